@@ -1,9 +1,18 @@
+import atexit
+import functools
+import os
+import re
 import sys
 from logging.config import fileConfig
 from pathlib import Path
 
+import psycopg2
+import psycopg2.errors
 from alembic import context
-from sqlalchemy import create_engine, engine_from_config, pool, text
+from psycopg2 import sql
+from psycopg2.errorcodes import INVALID_CATALOG_NAME
+from sqlalchemy import engine_from_config, pool, text
+from sqlalchemy.engine import URL, Connection, Engine
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.exc import OperationalError
 
@@ -15,14 +24,23 @@ sys.path.append(str(app_dir.parent))
 # Import Core modules
 from app.core.config import settings
 
-# Import all models to ensure they're registered with SQLAlchemy
-from app.models import *
-
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
 
+# Column type comparison reflects and compares every column's type, the most
+# expensive part of autogenerate. Most changes here are index-only, so it is
+# opt-in: set ALEMBIC_COMPARE_TYPE=1 when a migration changes column types.
+COMPARE_TYPE = os.environ.get("ALEMBIC_COMPARE_TYPE", "0") == "1"
+
+# Index name prefixes managed manually in migrations, never autogenerated
+_SKIP_INDEX_PREFIXES = ("ix_perf_",)
+_skip_index_match = re.compile(
+    "|".join(re.escape(prefix) for prefix in _SKIP_INDEX_PREFIXES)
+).match
+
+
 def include_object(object, name, type_, reflected, compare_to):
     """
     Filter objects for autogenerate.
@@ -34,71 +52,207 @@ def include_object(object, name, type_, reflected, compare_to):
     Convention: Any index starting with "ix_perf_" is automatically excluded.
     This allows adding new performance indexes without updating this file.
     """
-    if type_ == "index" and name:
-        # Convention-based: any index prefixed with ix_perf_ is manual
-        if name.startswith("ix_perf_"):
-            return False
-    return True
+    return not (type_ == "index" and name and _skip_index_match(name))
+
+
+def _compares_metadata() -> bool:
+    """
+    Whether this run compares the database against the models.
 
+    Only autogenerate (``revision --autogenerate``) and ``check`` read
+    target_metadata; upgrade/downgrade/current never do. Programmatic runs
+    (no CLI options) are assumed to need it.
+    """
+    cmd_opts = config.cmd_opts
+    if cmd_opts is None:
+        return True
+    command = getattr(cmd_opts, "cmd", None)
+    return bool(getattr(cmd_opts, "autogenerate", False)) or (
+        command is not None and command[0].__name__ == "check"
+    )
+
+
+def _is_upgrade() -> bool:
+    """
+    Whether this run is ``alembic upgrade``.
+
+    Status commands (current, history, check) and downgrades also run this
+    file online; programmatic runs (no CLI options) can't be told apart, so
+    they are treated as not upgrading.
+    """
+    command = getattr(config.cmd_opts, "cmd", None)
+    return command is not None and command[0].__name__ == "upgrade"
 
-# Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
 
-# add your model's MetaData object here
-# for 'autogenerate' support
-target_metadata = Base.metadata
+def load_target_metadata():
+    """
+    Return the models' MetaData for autogenerate support, or None.
+
+    Importing the models package (and with it the application's database
+    module) is skipped for runs that never look at the metadata.
+    """
+    if not _compares_metadata():
+        return None
+
+    # Importing the models package registers every model on Base.metadata
+    from app.models import Base
+
+    return Base.metadata
+
+
+target_metadata = load_target_metadata()
 
 # Override the SQLAlchemy URL with the one from settings
 config.set_main_option("sqlalchemy.url", settings.database_url)
 
 
-def ensure_database_exists(db_url: str) -> None:
+@functools.lru_cache(maxsize=1)
+def _get_engine(url: str) -> Engine:
     """
-    Ensure the target PostgreSQL database exists.
-    If connection to the target DB fails because it doesn't exist, connect to the
-    default 'postgres' database and create it. Safe to call multiple times.
+    Return the engine used for online migrations, built once per process.
+
+    A small LIFO QueuePool keeps the most recently used connection warm, so
+    repeated in-process runs (e.g. pytest-alembic) reuse it instead of paying
+    a fresh connect/auth handshake each time. Disposed at interpreter exit.
+
+    Migrations emit one-off DDL that is never executed twice, so the SQL
+    compilation cache is disabled rather than filled and checked per statement.
     """
-    try:
-        # First, try connecting to the target database
-        test_engine = create_engine(db_url, poolclass=pool.NullPool)
-        with test_engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-        test_engine.dispose()
-        return
-    except OperationalError:
-        # Likely the database does not exist; proceed to create it
-        pass
+    engine = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        url=url,
+        poolclass=pool.QueuePool,
+        pool_size=2,
+        max_overflow=0,
+        pool_use_lifo=True,
+        pool_pre_ping=True,
+        query_cache_size=0,
+    )
+    atexit.register(engine.dispose)
+    return engine
 
-    url = make_url(db_url)
-    # Only handle PostgreSQL here
-    if url.get_backend_name() != "postgresql":
-        return
 
-    target_db = url.database
-    if not target_db:
-        return
+def _libpq_dsn(url: URL) -> str:
+    """Render a SQLAlchemy URL as a libpq connection URI (no driver suffix)."""
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
 
-    # Build admin URL pointing to the default 'postgres' database
-    admin_url = url.set(database="postgres")
 
+def _create_database(url: URL) -> bool:
+    """
+    Create the database named in ``url`` from the default 'postgres' DB.
+
+    Returns False without creating anything if the database already exists.
+    """
     # CREATE DATABASE cannot run inside a transaction
-    admin_engine = create_engine(
-        str(admin_url), isolation_level="AUTOCOMMIT", poolclass=pool.NullPool
+    admin_conn = psycopg2.connect(
+        _libpq_dsn(url.set(database="postgres")), connect_timeout=2
     )
+    admin_conn.autocommit = True
     try:
-        with admin_engine.connect() as conn:
-            exists = conn.execute(
-                text("SELECT 1 FROM pg_database WHERE datname = :dbname"),
-                {"dbname": target_db},
-            ).scalar()
-            if not exists:
-                # Quote the database name safely
-                dbname_quoted = '"' + target_db.replace('"', '""') + '"'
-                conn.execute(text(f"CREATE DATABASE {dbname_quoted}"))
+        with admin_conn.cursor() as cur:
+            cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (url.database,))
+            if cur.fetchone() is not None:
+                return False
+            cur.execute(
+                sql.SQL("CREATE DATABASE {}").format(sql.Identifier(url.database))
+            )
+    except psycopg2.errors.DuplicateDatabase:
+        # Created concurrently by another migration run
+        pass
     finally:
-        admin_engine.dispose()
+        admin_conn.close()
+    return True
+
+
+def ensure_database_exists(db_url: str) -> Connection:
+    """
+    Connect to the target database, creating it first if it doesn't exist.
+
+    The connection handshake is the existence check, and the connection it
+    opens is returned for the migration run itself, so no separate probe
+    connection is made. A failed connect to a named PostgreSQL database falls
+    through to the admin connection, which creates the database only if
+    pg_database has no such entry; otherwise the original error is raised.
+    Safe to call multiple times.
+    """
+    engine = _get_engine(db_url)
+    try:
+        return engine.connect()
+    except OperationalError as e:
+        url = make_url(db_url)
+        if url.get_backend_name() != "postgresql" or not url.database:
+            raise
+        # Errors carrying a SQLSTATE other than invalid_catalog_name (3D000)
+        # are never a missing database. psycopg2 reports no SQLSTATE for
+        # errors raised while connecting, and the server's message is
+        # localized, so those are checked against pg_database instead.
+        pgcode = getattr(e.orig, "pgcode", None)
+        if pgcode not in (None, INVALID_CATALOG_NAME) or not _create_database(url):
+            raise
+    return engine.connect()
+
+
+# ix_perf_ indexes (the only ones upgrades build CONCURRENTLY) left INVALID
+# in the current schema by an interrupted build, excluding builds still in
+# progress in another session.
+_INVALID_INDEXES_QUERY = text(
+    """
+    SELECT c.relname
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE NOT i.indisvalid
+      AND n.nspname = current_schema()
+      AND c.relname LIKE 'ix\\_perf\\_%'
+      AND i.indexrelid NOT IN (
+          SELECT index_relid FROM pg_stat_progress_create_index
+      )
+    """
+)
+
+
+def drop_invalid_indexes(connection: Connection) -> None:
+    """
+    Drop migration indexes left INVALID by a failed concurrent build.
+
+    A CREATE INDEX CONCURRENTLY that fails or is cancelled leaves an invalid
+    index behind, and the retry's IF NOT EXISTS would then keep it as is:
+    present in the catalog, never used by the planner, still maintained on
+    every write. Dropping them before the run lets the migrations rebuild
+    them, as the PostgreSQL docs recommend.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    with connection.engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as conn:
+        for name in conn.execute(_INVALID_INDEXES_QUERY).scalars().all():
+            conn.execute(
+                text(
+                    "DROP INDEX CONCURRENTLY IF EXISTS "
+                    + conn.dialect.identifier_preparer.quote(name)
+                )
+            )
+
+
+def configure_logging() -> None:
+    """
+    Interpret the config file for Python logging, once per process.
+
+    Skipped when a programmatic caller manages logging itself and sets
+    ``config.attributes["configure_logger"] = False`` (the Alembic cookbook
+    convention). Existing loggers (the app modules imported above) are left
+    enabled instead of being silenced.
+    """
+    if (
+        config.config_file_name is None
+        or not config.attributes.get("configure_logger", True)
+        or getattr(config, "_logging_configured", False)
+    ):
+        return
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+    config._logging_configured = True
 
 
 def run_migrations_offline() -> None:
@@ -113,13 +267,16 @@ def run_migrations_offline() -> None:
     script output.
 
     """
+    configure_logging()
+
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
-        compare_type=True,
+        compare_type=COMPARE_TYPE,
+        include_schemas=False,
         include_object=include_object,
     )
 
@@ -134,20 +291,23 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    # Ensure the target database exists (handles first-run cases)
-    ensure_database_exists(settings.database_url)
-
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
-
-    with connectable.connect() as connection:
+    configure_logging()
+
+    # Ensure the target database exists (handles first-run cases) and reuse
+    # that connection for the migrations
+    with ensure_database_exists(settings.database_url) as connection:
+        if _is_upgrade():
+            drop_invalid_indexes(connection)
+
+        # Autogenerate reflects through Inspector.get_multi_*() (alembic>=1.18),
+        # pulling columns/indexes/constraints for every table in one query per
+        # kind instead of one per table. Restricting to the default schema keeps
+        # that pre-cache scoped to the tables we actually manage.
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
-            compare_type=True,
+            compare_type=COMPARE_TYPE,
+            include_schemas=False,
             include_object=include_object,
         )
 
@@ -0,0 +1,87 @@
+"""Add trigram search indexes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+Admin search filters with ILIKE '%term%', which no B-tree can serve.
+pg_trgm GIN indexes let Postgres answer these substring predicates with a
+bitmap index scan instead of a sequential scan.
+
+Indexes are built CONCURRENTLY (outside the migration transaction) so
+writes to users/organizations are not blocked while they build.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        # ======================================================================
+        # USERS TABLE - Admin user search
+        # ======================================================================
+
+        # Query: SELECT * FROM users WHERE deleted_at IS NULL
+        #        AND (email ILIKE :q OR first_name ILIKE :q OR last_name ILIKE :q)
+        # Impact: Medium - admin user listing with search
+        for column in ("email", "first_name", "last_name"):
+            op.create_index(
+                f"ix_perf_users_{column}_trgm",
+                "users",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_where=sa.text("deleted_at IS NULL"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+        # ======================================================================
+        # ORGANIZATIONS TABLE - Admin/organization search
+        # ======================================================================
+
+        # Query: SELECT * FROM organizations
+        #        WHERE name ILIKE :q OR slug ILIKE :q OR description ILIKE :q
+        # Impact: Low-Medium - organization listing with search. Every branch
+        # of the OR needs an index or the planner falls back to a seq scan.
+        for column in ("name", "slug", "description"):
+            op.create_index(
+                f"ix_perf_organizations_{column}_trgm",
+                "organizations",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in ("description", "slug", "name"):
+            op.drop_index(
+                f"ix_perf_organizations_{column}_trgm",
+                table_name="organizations",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        for column in ("last_name", "first_name", "email"):
+            op.drop_index(
+                f"ix_perf_users_{column}_trgm",
+                table_name="users",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
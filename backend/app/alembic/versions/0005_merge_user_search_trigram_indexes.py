@@ -0,0 +1,79 @@
+"""Merge user search trigram indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+The admin user search ORs three ILIKE predicates, which Postgres answers
+with a BitmapOr over three GIN scans. Searching a single concatenated
+expression instead needs one GIN scan, and users only maintain one index
+for this workload.
+
+The expression must stay in sync with the search clause in
+app/repositories/user.py so the planner can match it.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Query: SELECT * FROM users WHERE deleted_at IS NULL
+        #        AND LOWER(COALESCE(email, '') || ' ' || COALESCE(first_name, '')
+        #                  || ' ' || COALESCE(last_name, '')) ILIKE :q
+        # Impact: Medium - admin user listing with search
+        op.create_index(
+            "ix_perf_users_fulltext_trgm",
+            "users",
+            [
+                sa.text(
+                    "LOWER(COALESCE(email, '') || ' ' || COALESCE(first_name, '')"
+                    " || ' ' || COALESCE(last_name, '')) gin_trgm_ops"
+                )
+            ],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        for column in ("last_name", "first_name", "email"):
+            op.drop_index(
+                f"ix_perf_users_{column}_trgm",
+                table_name="users",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in ("email", "first_name", "last_name"):
+            op.create_index(
+                f"ix_perf_users_{column}_trgm",
+                "users",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_where=sa.text("deleted_at IS NULL"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+        op.drop_index(
+            "ix_perf_users_fulltext_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,55 @@
+"""Add user sessions cleanup index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+The nightly cleanup job deletes inactive, expired sessions older than the
+retention window. Only ix_perf_user_sessions_expires (partial on
+is_active = true) indexes expires_at, so the sweep scanned the table.
+
+Sessions are inserted in created_at order, so a BRIN index summarising
+page ranges narrows the sweep (created_at < retention cutoff) to the oldest
+part of the heap at a few KB of index, versus a B-tree entry per row.
+Per-user and JTI lookups keep their B-trees.
+
+autosummarize keeps newly filled ranges summarised without waiting for
+VACUUM.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Query: DELETE FROM user_sessions WHERE is_active = false
+        #        AND expires_at < NOW() AND created_at < :cutoff
+        # Impact: Medium - background session cleanup job
+        op.create_index(
+            "ix_perf_user_sessions_created_brin",
+            "user_sessions",
+            ["created_at"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32, "autosummarize": "on"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_perf_user_sessions_created_brin",
+            table_name="user_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
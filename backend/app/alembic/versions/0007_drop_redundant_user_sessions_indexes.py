@@ -0,0 +1,61 @@
+"""Drop redundant user sessions indexes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+
+- ix_user_sessions_jti_active (refresh_token_jti, is_active): the JTI is
+  already unique, so the unique index finds the single row and is_active
+  is rechecked on the heap.
+- ix_user_sessions_user_id (user_id): a prefix of
+  ix_user_sessions_user_active (user_id, is_active), which serves the same
+  lookups.
+
+Both only added write cost on every session insert and refresh.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_sessions_jti_active",
+            table_name="user_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_user_sessions_user_id",
+            table_name="user_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_sessions_user_id",
+            "user_sessions",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_user_sessions_jti_active",
+            "user_sessions",
+            ["refresh_token_jti", "is_active"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,48 @@
+"""Add user sessions listing index
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+
+"List my active sessions" filters by user and is_active and sorts by
+last_used_at DESC. With only ix_user_sessions_user_active, Postgres has to
+sort the matching rows. A partial index over active sessions, ordered the
+same way, returns them already sorted and skips revoked sessions entirely.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: str | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Query: SELECT * FROM user_sessions WHERE user_id = :user_id
+        #        AND is_active = true ORDER BY last_used_at DESC
+        # Impact: High - session list on every account/security page load
+        op.create_index(
+            "ix_perf_user_sessions_user_last_used",
+            "user_sessions",
+            ["user_id", sa.text("last_used_at DESC")],
+            unique=False,
+            postgresql_where=sa.text("is_active = true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_perf_user_sessions_user_last_used",
+            table_name="user_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
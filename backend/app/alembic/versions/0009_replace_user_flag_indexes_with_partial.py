@@ -0,0 +1,111 @@
+"""Replace user flag indexes with partial indexes
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+
+ix_users_is_active, ix_users_is_superuser and ix_perf_users_active are
+B-trees over booleans with two distinct values; the planner seq-scans for
+the common value anyway, yet every user insert pays to maintain all
+three. Admin queries only ever want the minority sets (superusers,
+deactivated users), so index exactly those rows.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: str | None = "0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Query: SELECT * FROM users WHERE deleted_at IS NULL AND is_superuser = true
+        # Impact: Low - admin user listing filtered to superusers
+        op.create_index(
+            "ix_perf_users_superusers",
+            "users",
+            ["id"],
+            unique=False,
+            postgresql_where=sa.text("is_superuser AND deleted_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # Query: SELECT * FROM users WHERE deleted_at IS NULL AND is_active = false
+        # Impact: Low - admin user listing filtered to deactivated users
+        op.create_index(
+            "ix_perf_users_inactive",
+            "users",
+            ["id"],
+            unique=False,
+            postgresql_where=sa.text("NOT is_active AND deleted_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        op.drop_index(
+            "ix_perf_users_active",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_users_is_superuser",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_users_is_active",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_is_active",
+            "users",
+            ["is_active"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_users_is_superuser",
+            "users",
+            ["is_superuser"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_perf_users_active",
+            "users",
+            ["is_active"],
+            unique=False,
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        op.drop_index(
+            "ix_perf_users_inactive",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_perf_users_superusers",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
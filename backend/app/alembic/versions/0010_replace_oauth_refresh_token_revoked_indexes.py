@@ -0,0 +1,80 @@
+"""Replace OAuth refresh token revoked indexes with a partial index
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+
+Per-user refresh token lookups only ever want tokens that are still
+active (revoked = false), yet ix_oauth_provider_refresh_tokens_user_revoked
+indexes every revoked token too, and they accumulate until cleanup. The
+standalone boolean ix_oauth_provider_refresh_tokens_revoked is never
+selective enough for the planner to use. One partial index on user_id
+covers the active rows only.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: str | None = "0009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Query: UPDATE oauth_provider_refresh_tokens SET revoked = true
+        #        WHERE user_id = :user_id [AND client_id = :client_id] AND revoked = false
+        # Impact: Medium - password change, logout everywhere, code reuse response
+        op.create_index(
+            "ix_perf_oauth_refresh_tokens_user_active",
+            "oauth_provider_refresh_tokens",
+            ["user_id"],
+            unique=False,
+            postgresql_where=sa.text("revoked = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        op.drop_index(
+            "ix_oauth_provider_refresh_tokens_user_revoked",
+            table_name="oauth_provider_refresh_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_oauth_provider_refresh_tokens_revoked",
+            table_name="oauth_provider_refresh_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_oauth_provider_refresh_tokens_revoked",
+            "oauth_provider_refresh_tokens",
+            ["revoked"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_oauth_provider_refresh_tokens_user_revoked",
+            "oauth_provider_refresh_tokens",
+            ["user_id", "revoked"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        op.drop_index(
+            "ix_perf_oauth_refresh_tokens_user_active",
+            table_name="oauth_provider_refresh_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,69 @@
+"""Drop redundant user_organizations indexes
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+
+user_organizations carried five indexes besides its primary key:
+- ix_user_org_user_active (user_id, is_active) duplicates the leading
+  user_id column of the (user_id, organization_id) primary key; a user has
+  a handful of memberships, so filtering is_active on top costs nothing.
+- ix_user_organizations_is_active and ix_user_org_role are single-column
+  indexes over two- and four-valued columns that no query filters on alone.
+
+All three only added write amplification. ix_user_org_org_active stays: it
+serves member listings for every is_active filter (active, inactive, all).
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: str | None = "0010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in (
+            "ix_user_org_user_active",
+            "ix_user_organizations_is_active",
+            "ix_user_org_role",
+        ):
+            op.drop_index(
+                index_name,
+                table_name="user_organizations",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_org_role",
+            "user_organizations",
+            ["role"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_user_organizations_is_active",
+            "user_organizations",
+            ["is_active"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_user_org_user_active",
+            "user_organizations",
+            ["user_id", "is_active"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,47 @@
+"""Store OAuth refresh token hashes as bytea
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18
+
+token_hash holds a SHA-256 digest as 64 hex characters and is looked up
+through a unique index on every refresh and revocation. Stored as the raw
+32 bytes, the column and its index are half the size and compare
+byte-wise instead of through the text collation.
+
+ALTER COLUMN ... TYPE rewrites the table and rebuilds its indexes under an
+ACCESS EXCLUSIVE lock; refresh token requests wait for it to finish.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: str | None = "0011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "oauth_provider_refresh_tokens",
+        "token_hash",
+        type_=sa.LargeBinary(length=32),
+        existing_type=sa.String(length=64),
+        existing_nullable=False,
+        postgresql_using="decode(token_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "oauth_provider_refresh_tokens",
+        "token_hash",
+        type_=sa.String(length=64),
+        existing_type=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using="encode(token_hash, 'hex')",
+    )
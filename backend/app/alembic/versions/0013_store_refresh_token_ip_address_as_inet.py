@@ -0,0 +1,50 @@
+"""Store OAuth refresh token IP addresses as inet
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18
+
+ip_address is written on every token issue and refresh. As inet it takes
+7 (IPv4) or 19 (IPv6) bytes instead of up to 45 characters of text, and
+compares as an address. Existing values that aren't valid addresses become
+NULL, matching what the IPAddress column type now does for new rows.
+
+The conversion rewrites the table under an ACCESS EXCLUSIVE lock and
+needs pg_input_is_valid() (PostgreSQL 16+).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0013"
+down_revision: str | None = "0012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "oauth_provider_refresh_tokens",
+        "ip_address",
+        type_=postgresql.INET(),
+        existing_type=sa.String(length=45),
+        existing_nullable=True,
+        postgresql_using=(
+            "CASE WHEN pg_input_is_valid(ip_address, 'inet') THEN ip_address::inet END"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "oauth_provider_refresh_tokens",
+        "ip_address",
+        type_=sa.String(length=45),
+        existing_type=postgresql.INET(),
+        existing_nullable=True,
+        postgresql_using="host(ip_address)",
+    )
@@ -0,0 +1,51 @@
+"""Add users created_at index
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-18
+
+The admin dashboard buckets registrations of the last 30 days by day
+(created_at >= :since GROUP BY date(created_at)), counting active users
+per bucket. With is_active carried in the index leaf, Postgres answers it
+with an index-only range scan instead of reading the whole users table.
+
+The index is not partial: dashboard counts include soft-deleted users. The
+admin user list (deleted_at IS NULL ORDER BY created_at DESC LIMIT n) walks
+the same index backwards and filters the few deleted rows it meets.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0014"
+down_revision: str | None = "0013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Query: SELECT date(created_at), count(*), sum(CASE WHEN is_active ...)
+        #        FROM users WHERE created_at >= :since GROUP BY date(created_at)
+        # Impact: Medium - admin dashboard stats
+        op.create_index(
+            "ix_perf_users_created_at",
+            "users",
+            ["created_at"],
+            unique=False,
+            postgresql_include=["is_active"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_perf_users_created_at",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,53 @@
+"""Add user sessions active last_used_at index
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-18
+
+The admin session list shows active sessions across all users, newest
+activity first (is_active = true ORDER BY last_used_at DESC LIMIT n), and
+counts them. ix_perf_user_sessions_user_last_used leads with user_id, so it
+can't return that order. A partial index over active sessions keyed on
+last_used_at alone returns the page already sorted and gives the count an
+index-only scan that never reads revoked or expired sessions.
+
+Users need no counterpart: the admin user list already walks
+ix_perf_users_created_at (migration 0014) backwards.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0015"
+down_revision: str | None = "0014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Query: SELECT ... FROM user_sessions JOIN users ...
+        #        WHERE is_active = true ORDER BY last_used_at DESC LIMIT :n
+        # Impact: Medium - admin session listing
+        op.create_index(
+            "ix_perf_user_sessions_active_last_used",
+            "user_sessions",
+            [sa.text("last_used_at DESC")],
+            unique=False,
+            postgresql_where=sa.text("is_active = true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_perf_user_sessions_active_last_used",
+            table_name="user_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
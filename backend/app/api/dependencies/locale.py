@@ -8,6 +8,9 @@ Implements a three-tier fallback system:
 3. Default to English ("en")
 """
 
+import functools
+import re
+
 from fastapi import Depends, Request
 
 from app.api.dependencies.auth import get_optional_current_user
@@ -17,10 +20,16 @@ from app.models.user import User
 # Template showcases English and Italian
 # Users can extend by adding more locales here
 # Note: Stored in lowercase for case-insensitive matching
-SUPPORTED_LOCALES = {"en", "it", "en-us", "en-gb", "it-it"}
+SUPPORTED_LOCALES = frozenset({"en", "it", "en-us", "en-gb", "it-it"})
 DEFAULT_LOCALE = "en"
 
+# One Accept-Language entry: its language tag without surrounding whitespace,
+# up to the entry's optional ";q=..." parameters. Matched against the
+# lowercased header, in header order.
+_ACCEPT_LANGUAGE_ENTRY = re.compile(r"(?:^|,)\s*([^,;]*?)\s*(?=[;,]|$)")
+
 
+@functools.lru_cache(maxsize=512)
 def parse_accept_language(accept_language: str) -> str | None:
     """
     Parse the Accept-Language header and return the best matching supported locale.
@@ -29,7 +38,8 @@ def parse_accept_language(accept_language: str) -> str | None:
     "it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7"
 
     This function extracts locales in priority order (by quality value) and returns
-    the first one that matches our supported locales.
+    the first one that matches our supported locales. Results are memoized:
+    real traffic sends the same handful of header values over and over.
 
     Args:
         accept_language: The Accept-Language header value
@@ -46,25 +56,17 @@ def parse_accept_language(accept_language: str) -> str | None:
     if not accept_language:
         return None
 
-    # Split by comma to get individual locale entries
-    # Format: "locale;q=weight" or just "locale"
-    locales = []
-    for entry in accept_language.split(","):
-        # Remove quality value (;q=0.9) if present
-        locale = entry.split(";")[0].strip()
-        if locale:
-            locales.append(locale)
-
-    # Check each locale in priority order
-    for locale in locales:
-        locale_lower = locale.lower()
-
-        # Try exact match first (e.g., "it-IT")
-        if locale_lower in SUPPORTED_LOCALES:
-            return locale_lower
-
-        # Try language code only (e.g., "it" from "it-IT")
-        lang_code = locale_lower.split("-")[0]
+    for match in _ACCEPT_LANGUAGE_ENTRY.finditer(accept_language.lower()):
+        locale = match.group(1)
+        if not locale:
+            continue
+
+        # Try exact match first (e.g., "it-it")
+        if locale in SUPPORTED_LOCALES:
+            return locale
+
+        # Try language code only (e.g., "it" from "it-it")
+        lang_code = locale.partition("-")[0]
         if lang_code in SUPPORTED_LOCALES:
             return lang_code
 
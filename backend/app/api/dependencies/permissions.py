@@ -8,18 +8,49 @@ These dependencies are optional and flexible:
 - Projects can choose to use these or implement their own permission system
 """
 
+import inspect
+from collections.abc import Hashable, Iterator
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.api.dependencies.auth import get_current_user
+from app.core.cache import ALL_KEYS, InvalidatingTTLCache
+from app.core.config import settings
 from app.core.database import get_db
+from app.models.organization import Organization
 from app.models.user import User
-from app.models.user_organization import OrganizationRole
+from app.models.user_organization import OrganizationRole, UserOrganization
 from app.services.organization_service import organization_service
 
 
+def _stale_roles(session: Session) -> Iterator[Hashable]:
+    """(user_id, organization_id) keys of the memberships a flush changes."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, UserOrganization):
+            yield (obj.user_id, obj.organization_id)
+    # Deleting a user or organization cascades to memberships in the database
+    if any(isinstance(obj, User | Organization) for obj in session.deleted):
+        yield ALL_KEYS
+
+
+# Recent role lookups keyed by (user_id, organization_id). Non-members are
+# cached too (as None), so repeated denied requests don't reach the database.
+_role_cache = InvalidatingTTLCache(
+    maxsize=settings.ORG_ROLE_CACHE_MAXSIZE,
+    ttl=settings.ORG_ROLE_CACHE_TTL_SECONDS,
+    stale_keys=_stale_roles,
+    bulk_mappers=(
+        UserOrganization.__mapper__,
+        User.__mapper__,
+        Organization.__mapper__,
+    ),
+)
+_MISSING = object()
+
+
 def require_superuser(current_user: User = Depends(get_current_user)) -> User:
     """
     Dependency to ensure the current user is a superuser.
@@ -39,6 +70,33 @@ def require_superuser(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
+async def _get_user_role(
+    organization_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> OrganizationRole | None:
+    """
+    Look up the current user's role in the requested organization.
+
+    Shared sub-dependency of every organization permission check: FastAPI
+    caches dependency results per request, so routes stacking several checks
+    still query the role once. Across requests, roles are served from a
+    short-lived per-worker cache. Superusers are treated as owners without a
+    query.
+    """
+    if current_user.is_superuser:
+        return OrganizationRole.OWNER
+
+    key = (current_user.id, organization_id)
+    role = _role_cache.get(key, _MISSING)
+    if role is _MISSING:
+        role = await organization_service.get_user_role_in_org(
+            db, user_id=current_user.id, organization_id=organization_id
+        )
+        _role_cache.set(key, role)
+    return role
+
+
 class OrganizationPermission:
     """
     Factory for organization-based permission checking.
@@ -54,21 +112,24 @@ class OrganizationPermission:
         Args:
             allowed_roles: List of roles that can access the endpoint
         """
-        self.allowed_roles = allowed_roles
+        self.allowed_roles = frozenset(allowed_roles)
+        # Resolved once here so dependency analysis of every route using this
+        # instance reads it directly instead of re-deriving it from __call__
+        self.__signature__ = inspect.signature(self.__call__)
+        # Rendered once from the caller's ordered list for denial messages
+        self._required_detail = f"not authorized. Required: {allowed_roles}"
 
     async def __call__(
         self,
-        organization_id: UUID,
         current_user: User = Depends(get_current_user),
-        db: AsyncSession = Depends(get_db),
+        user_role: OrganizationRole | None = Depends(_get_user_role),
     ) -> User:
         """
         Check if user has required role in the organization.
 
         Args:
-            organization_id: The organization to check access for
             current_user: The authenticated user
-            db: Database session
+            user_role: The user's role in the requested organization
 
         Returns:
             The current user if they have permission
@@ -80,11 +141,6 @@ class OrganizationPermission:
         if current_user.is_superuser:
             return current_user
 
-        # Get user's role in organization
-        user_role = await organization_service.get_user_role_in_org(
-            db, user_id=current_user.id, organization_id=organization_id
-        )
-
         if not user_role:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -94,7 +150,9 @@ class OrganizationPermission:
         if user_role not in self.allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role {user_role} not authorized. Required: {self.allowed_roles}",
+                # Spelled out so the detail still reads "OrganizationRole.MEMBER",
+                # as it did before the role enum became a StrEnum
+                detail=f"Role OrganizationRole.{user_role.name} {self._required_detail}",
             )
 
         return current_user
@@ -111,9 +169,8 @@ require_org_member = OrganizationPermission(
 
 
 async def require_org_membership(
-    organization_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    user_role: OrganizationRole | None = Depends(_get_user_role),
 ) -> User:
     """
     Ensure user is a member of the organization (any role).
@@ -123,10 +180,6 @@ async def require_org_membership(
     if current_user.is_superuser:
         return current_user
 
-    user_role = await organization_service.get_user_role_in_org(
-        db, user_id=current_user.id, organization_id=organization_id
-    )
-
     if not user_role:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
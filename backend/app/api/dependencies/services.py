@@ -1,9 +1,8 @@
 # app/api/dependencies/services.py
 """FastAPI dependency functions for service singletons."""
 
-from app.services import oauth_provider_service
-from app.services.auth_service import AuthService
-from app.services.oauth_service import OAuthService
+from app.services.auth_service import AuthService, auth_service
+from app.services.oauth_service import OAuthService, oauth_service
 from app.services.organization_service import OrganizationService, organization_service
 from app.services.session_service import SessionService, session_service
 from app.services.user_service import UserService, user_service
@@ -11,9 +10,7 @@ from app.services.user_service import UserService, user_service
 
 def get_auth_service() -> AuthService:
     """Return the AuthService singleton for dependency injection."""
-    from app.services.auth_service import AuthService as _AuthService
-
-    return _AuthService()
+    return auth_service
 
 
 def get_user_service() -> UserService:
@@ -32,10 +29,5 @@ def get_session_service() -> SessionService:
 
 
 def get_oauth_service() -> OAuthService:
-    """Return OAuthService for dependency injection."""
-    return OAuthService()
-
-
-def get_oauth_provider_service():
-    """Return the oauth_provider_service module for dependency injection."""
-    return oauth_provider_service
+    """Return the OAuthService singleton for dependency injection."""
+    return oauth_service
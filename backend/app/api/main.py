@@ -11,14 +11,17 @@ from app.api.routes import (
 )
 
 api_router = APIRouter()
-api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
-api_router.include_router(oauth.router, prefix="/oauth", tags=["OAuth"])
+# Starlette matches routes by scanning them in include order, so the
+# high-traffic routers go first and the rarely hit ones last. No two routers
+# serve the same path, so the order never changes which route matches.
+api_router.include_router(users.router, prefix="/users", tags=["Users"])
 api_router.include_router(
-    oauth_provider.router, prefix="/oauth", tags=["OAuth Provider"]
+    organizations.router, prefix="/organizations", tags=["Organizations"]
 )
-api_router.include_router(users.router, prefix="/users", tags=["Users"])
 api_router.include_router(sessions.router, prefix="/sessions", tags=["Sessions"])
+api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
+api_router.include_router(oauth.router, prefix="/oauth", tags=["OAuth"])
 api_router.include_router(
-    organizations.router, prefix="/organizations", tags=["Organizations"]
+    oauth_provider.router, prefix="/oauth", tags=["OAuth Provider"]
 )
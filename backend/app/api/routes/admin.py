@@ -6,45 +6,58 @@ These endpoints require superuser privileges and provide CMS-like functionality
 for managing the application.
 """
 
+import functools
 import logging
-from datetime import UTC, datetime, timedelta
+from collections.abc import Hashable, Iterator
+from datetime import UTC, date, datetime, time, timedelta
 from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.api.dependencies.permissions import require_superuser
-from app.core.database import get_db
+from app.core.cache import ALL_KEYS, InvalidatingTTLCache
+from app.core.config import settings
+from app.core.database import get_db, get_pool_stats
 from app.core.exceptions import (
     AuthorizationError,
     DuplicateError,
     ErrorCode,
     NotFoundError,
+    ValidationException,
 )
 from app.core.repository_exceptions import DuplicateEntryError
+from app.models.organization import Organization
 from app.models.user import User
-from app.models.user_organization import OrganizationRole
+from app.models.user_organization import OrganizationRole, UserOrganization
 from app.schemas.common import (
     MessageResponse,
     PaginatedResponse,
     PaginationParams,
     SortParams,
     create_pagination_meta,
+    decode_cursor,
+    encode_cursor,
 )
 from app.schemas.organizations import (
     OrganizationCreate,
     OrganizationMemberResponse,
     OrganizationResponse,
     OrganizationUpdate,
+    organization_members_adapter,
+    organizations_adapter,
 )
-from app.schemas.sessions import AdminSessionResponse
-from app.schemas.users import UserCreate, UserResponse, UserUpdate
+from app.schemas.sessions import AdminSessionResponse, admin_sessions_adapter
+from app.schemas.users import UserCreate, UserResponse, UserUpdate, users_adapter
 from app.services.organization_service import organization_service
 from app.services.session_service import session_service
 from app.services.user_service import user_service
+from app.utils.etag import CACHE_CONTROL, etag_matches, make_list_etag, not_modified
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +95,16 @@ class BulkActionResult(BaseModel):
 # ===== User Management Endpoints =====
 
 
+def _parse_cursor(cursor: str | None) -> tuple[datetime, UUID] | None:
+    """Decode a keyset cursor query parameter, rejecting malformed ones with 422."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise ValidationException(message="Invalid cursor", field="cursor")
+
+
 class UserGrowthData(BaseModel):
     date: str
     total_users: int
@@ -110,19 +133,56 @@ class AdminStatsResponse(BaseModel):
     user_status: list[UserStatusData]
 
 
-def _generate_demo_stats() -> AdminStatsResponse:  # pragma: no cover
-    """Generate demo statistics for empty databases."""
+class PoolStatsResponse(BaseModel):
+    size: int = Field(..., description="Configured number of pooled connections")
+    checked_in: int = Field(..., description="Idle connections in the pool")
+    checked_out: int = Field(..., description="Connections currently in use")
+    overflow: int = Field(..., description="Connections open beyond size")
+    max_overflow: int = Field(..., description="Configured overflow limit")
+
+
+def _stale_stats(session: Session) -> Iterator[Hashable]:
+    if any(
+        isinstance(obj, User | Organization | UserOrganization)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        yield ALL_KEYS
+
+
+# Dashboard stats, recomputed at most once per TTL unless users, organizations
+# or memberships are written through this worker in the meantime.
+_stats_cache = InvalidatingTTLCache(
+    maxsize=1,
+    ttl=settings.ADMIN_STATS_CACHE_TTL_SECONDS,
+    stale_keys=_stale_stats,
+    bulk_mappers=(
+        User.__mapper__,
+        Organization.__mapper__,
+        UserOrganization.__mapper__,
+    ),
+)
+_STATS_KEY = "admin_stats"
+
+
+@functools.lru_cache(maxsize=1)
+def _generate_demo_stats(today: date) -> AdminStatsResponse:  # pragma: no cover
+    """
+    Generate demo statistics for empty databases.
+
+    Cached per day: the numbers are random but stay put on reloads, and the
+    date labels roll over with ``today``.
+    """
     from random import randint
 
     # Demo user growth (last 30 days)
     user_growth = []
     total = 10
     for i in range(29, -1, -1):
-        date = datetime.now(UTC) - timedelta(days=i)
+        day = today - timedelta(days=i)
         total += randint(0, 3)  # noqa: S311
         user_growth.append(
             UserGrowthData(
-                date=date.strftime("%b %d"),
+                date=day.strftime("%b %d"),
                 total_users=total,
                 active_users=int(total * 0.85),
             )
@@ -141,10 +201,10 @@ def _generate_demo_stats() -> AdminStatsResponse:  # pragma: no cover
     # Demo registration activity (last 14 days)
     registration_activity = []
     for i in range(13, -1, -1):
-        date = datetime.now(UTC) - timedelta(days=i)
+        day = today - timedelta(days=i)
         registration_activity.append(
             RegistrationActivityData(
-                date=date.strftime("%b %d"),
+                date=day.strftime("%b %d"),
                 registrations=randint(0, 5),  # noqa: S311
             )
         )
@@ -175,42 +235,41 @@ async def admin_get_stats(
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """Get admin dashboard statistics with real data from database."""
-    from app.core.config import settings
+    cached = _stats_cache.get(_STATS_KEY)
+    if cached is not None:
+        return cached
 
     stats = await user_service.get_stats(db)
     total_users = stats["total_users"]
     active_count = stats["active_count"]
     inactive_count = stats["inactive_count"]
-    all_users = stats["all_users"]
 
     # If database is essentially empty (only admin user), return demo data
     if total_users <= 1 and settings.DEMO_MODE:  # pragma: no cover
         logger.info("Returning demo stats data (empty database in demo mode)")
-        return _generate_demo_stats()
+        return _generate_demo_stats(datetime.now(UTC).date())
+
+    # Per-day registrations for the last 30 days, bucketed by the database
+    today = datetime.now(UTC).date()
+    days = [today - timedelta(days=i) for i in range(29, -1, -1)]
+    labels = [day.strftime("%b %d") for day in days]
+    daily = await user_service.get_daily_registrations(
+        db, since=datetime.combine(days[0], time.min, tzinfo=UTC)
+    )
 
     # 1. User Growth (Last 30 days)
+    # Walk the window forward from the users created before it
+    total_users_on_date = total_users - sum(n for n, _ in daily.values())
+    active_users_on_date = active_count - sum(a for _, a in daily.values())
     user_growth = []
-    for i in range(29, -1, -1):
-        date = datetime.now(UTC) - timedelta(days=i)
-        date_start = date.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=UTC)
-        date_end = date_start + timedelta(days=1)
-
-        total_users_on_date = sum(
-            1
-            for u in all_users
-            if u.created_at and u.created_at.replace(tzinfo=UTC) < date_end
-        )
-        active_users_on_date = sum(
-            1
-            for u in all_users
-            if u.created_at
-            and u.created_at.replace(tzinfo=UTC) < date_end
-            and u.is_active
-        )
+    for day, label in zip(days, labels, strict=True):
+        registrations, active_registrations = daily.get(day, (0, 0))
+        total_users_on_date += registrations
+        active_users_on_date += active_registrations
 
         user_growth.append(
             UserGrowthData(
-                date=date.strftime("%b %d"),
+                date=label,
                 total_users=total_users_on_date,
                 active_users=active_users_on_date,
             )
@@ -221,25 +280,13 @@ async def admin_get_stats(
     org_dist = [OrgDistributionData(name=r["name"], value=r["value"]) for r in org_rows]
 
     # 3. User Registration Activity (Last 14 days)
-    registration_activity = []
-    for i in range(13, -1, -1):
-        date = datetime.now(UTC) - timedelta(days=i)
-        date_start = date.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=UTC)
-        date_end = date_start + timedelta(days=1)
-
-        day_registrations = sum(
-            1
-            for u in all_users
-            if u.created_at
-            and date_start <= u.created_at.replace(tzinfo=UTC) < date_end
-        )
-
-        registration_activity.append(
-            RegistrationActivityData(
-                date=date.strftime("%b %d"),
-                registrations=day_registrations,
-            )
+    registration_activity = [
+        RegistrationActivityData(
+            date=label,
+            registrations=daily.get(day, (0, 0))[0],
         )
+        for day, label in zip(days[-14:], labels[-14:], strict=True)
+    ]
 
     # 4. User Status - Active vs Inactive
     logger.info(
@@ -251,12 +298,39 @@ async def admin_get_stats(
         UserStatusData(name="Inactive", value=inactive_count),
     ]
 
-    return AdminStatsResponse(
+    response = AdminStatsResponse(
         user_growth=user_growth,
         organization_distribution=org_dist,
         registration_activity=registration_activity,
         user_status=user_status,
     )
+    _stats_cache.set(_STATS_KEY, response)
+    return response
+
+
+@router.get(
+    "/pool-stats",
+    response_model=PoolStatsResponse,
+    summary="Admin: Get Database Pool Stats",
+    description="Get current database connection pool usage (admin only)",
+    operation_id="admin_get_pool_stats",
+)
+async def admin_get_pool_stats(
+    admin: User = Depends(require_superuser),
+) -> Any:
+    """
+    Get a snapshot of the database connection pool.
+
+    Used to check the pool settings under load: checked_out near
+    size + max_overflow means requests are waiting for connections.
+    """
+    stats = get_pool_stats()
+    if stats is None:
+        raise NotFoundError(
+            message="Connection pool does not report usage",
+            error_code=ErrorCode.NOT_FOUND,
+        )
+    return stats
 
 
 # ===== User Management Endpoints =====
@@ -270,18 +344,30 @@ async def admin_get_stats(
     operation_id="admin_list_users",
 )
 async def admin_list_users(
+    request: Request,
+    response: Response,
     pagination: PaginationParams = Depends(),
     sort: SortParams = Depends(),
     is_active: bool | None = Query(None, description="Filter by active status"),
     is_superuser: bool | None = Query(None, description="Filter by superuser status"),
     search: str | None = Query(None, description="Search by email, name"),
+    include_total: bool = Query(
+        True,
+        description="Count matching items; false skips the COUNT and only reports has_next",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="next_cursor of the previous page; pages by keyset instead of offset and skips the COUNT",
+    ),
     admin: User = Depends(require_superuser),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
     List all users with comprehensive filtering and search.
 
-    Requires superuser privileges.
+    Responses with an exact total carry an ETag and answer 304 Not Modified
+    when If-None-Match matches it, which only costs one count/max(updated_at)
+    query. Requires superuser privileges.
     """
     try:
         # Build filters
@@ -291,31 +377,95 @@ async def admin_list_users(
         if is_superuser is not None:
             filters["is_superuser"] = is_superuser
 
-        # Get users with search
-        users, total = await user_service.list_users(
-            db,
-            skip=pagination.offset,
-            limit=pagination.limit,
-            sort_by=sort.sort_by or "created_at",
-            sort_order=sort.sort_order.value if sort.sort_order else "desc",
-            filters=filters if filters else None,
-            search=search,
-        )
+        list_kwargs = {
+            "skip": pagination.offset,
+            "limit": pagination.limit,
+            "sort_by": sort.sort_by or "created_at",
+            "sort_order": sort.sort_order.value if sort.sort_order else "desc",
+            "filters": filters if filters else None,
+            "search": search,
+        }
+
+        keyset = list_kwargs["sort_by"] == "created_at"
+        after = _parse_cursor(cursor)
+        if after is not None:
+            if not keyset:
+                raise ValidationException(
+                    message="cursor requires sorting by created_at", field="cursor"
+                )
+            list_kwargs["skip"] = 0
+
+        # Get users with search. The list always excludes soft-deleted users,
+        # so the table-wide planner estimate would overcount: always count.
+        total: int | None = None
+        has_next: bool | None = None
+        if include_total and after is None:
+            # The change marker scans the table like the COUNT below, so only
+            # the exact-count path pays for a validator
+            etag = make_list_etag(request, *await user_service.get_change_marker(db))
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = CACHE_CONTROL
+
+            users, total = await user_service.list_users(db, **list_kwargs)
+        else:
+            users, has_next = await user_service.list_users_page(
+                db, after=after, **list_kwargs
+            )
 
         pagination_meta = create_pagination_meta(
             total=total,
             page=pagination.page,
             limit=pagination.limit,
             items_count=len(users),
+            has_next=has_next,
         )
+        if keyset and pagination_meta.has_next and users:
+            pagination_meta.next_cursor = encode_cursor(
+                users[-1].created_at, users[-1].id
+            )
 
-        return PaginatedResponse(data=users, pagination=pagination_meta)
+        return PaginatedResponse(
+            data=users_adapter.validate_python(users), pagination=pagination_meta
+        )
 
     except Exception as e:
         logger.exception("Error listing users (admin): %s", e)
         raise
 
 
+@router.get(
+    "/users/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+    summary="Admin: Export Users",
+    description="Stream all users as newline-delimited JSON (admin only)",
+    operation_id="admin_export_users",
+)
+async def admin_export_users(
+    admin: User = Depends(require_superuser),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Export every user as one JSON object per line.
+
+    Users are read and serialized one batch at a time, so memory use does not
+    grow with the user count and the first rows go out before the last are
+    read. Requires superuser privileges.
+    """
+
+    async def ndjson_lines():
+        async for batch in user_service.stream_users(db):
+            yield "".join(
+                UserResponse.model_validate(user).model_dump_json() + "\n"
+                for user in batch
+            )
+
+    logger.info("Admin %s exported users", admin.email)
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.post(
     "/users",
     response_model=UserResponse,
@@ -487,6 +637,21 @@ async def admin_deactivate_user(
         raise
 
 
+# Bulk action -> operation(db, user_ids, admin_id), dispatched by lookup
+_BULK_ACTIONS = {
+    BulkAction.ACTIVATE: lambda db, user_ids, _admin_id: (
+        user_service.bulk_update_status(db, user_ids=user_ids, is_active=True)
+    ),
+    BulkAction.DEACTIVATE: lambda db, user_ids, _admin_id: (
+        user_service.bulk_update_status(db, user_ids=user_ids, is_active=False)
+    ),
+    # Deleting never touches the acting admin
+    BulkAction.DELETE: lambda db, user_ids, admin_id: user_service.bulk_soft_delete(
+        db, user_ids=user_ids, exclude_user_id=admin_id
+    ),
+}
+
+
 @router.post(
     "/users/bulk-action",
     response_model=BulkActionResult,
@@ -507,25 +672,18 @@ async def admin_bulk_user_action(
     """
     try:
         # Use efficient bulk operations instead of loop
-        if bulk_action.action == BulkAction.ACTIVATE:
-            affected_count = await user_service.bulk_update_status(
-                db, user_ids=bulk_action.user_ids, is_active=True
-            )
-        elif bulk_action.action == BulkAction.DEACTIVATE:
-            affected_count = await user_service.bulk_update_status(
-                db, user_ids=bulk_action.user_ids, is_active=False
-            )
-        elif bulk_action.action == BulkAction.DELETE:
-            # bulk_soft_delete automatically excludes the admin user
-            affected_count = await user_service.bulk_soft_delete(
-                db, user_ids=bulk_action.user_ids, exclude_user_id=admin.id
-            )
-        else:  # pragma: no cover
-            raise ValueError(f"Unsupported bulk action: {bulk_action.action}")
+        affected_ids = set(
+            await _BULK_ACTIONS[bulk_action.action](db, bulk_action.user_ids, admin.id)
+        )
 
-        # Calculate failed count (requested - affected)
-        requested_count = len(bulk_action.user_ids)
-        failed_count = requested_count - affected_count
+        # The UPDATE returns the rows it changed, so the rest were skipped
+        failed_ids = [
+            user_id
+            for user_id in dict.fromkeys(bulk_action.user_ids)
+            if user_id not in affected_ids
+        ]
+        affected_count = len(affected_ids)
+        failed_count = len(failed_ids)
 
         logger.info(
             "Admin %s performed bulk %s on %s users (%s skipped/failed)",
@@ -535,12 +693,13 @@ async def admin_bulk_user_action(
             failed_count,
         )
 
+        # success means the action ran; skipped users are reported in failed_ids
         return BulkActionResult(
-            success=failed_count == 0,
+            success=True,
             affected_count=affected_count,
             failed_count=failed_count,
             message=f"Bulk {bulk_action.action.value}: {affected_count} users affected, {failed_count} skipped",
-            failed_ids=None,  # Bulk operations don't track individual failures
+            failed_ids=failed_ids,
         )
 
     except Exception as e:  # pragma: no cover
@@ -559,48 +718,82 @@ async def admin_bulk_user_action(
     operation_id="admin_list_organizations",
 )
 async def admin_list_organizations(
+    request: Request,
+    response: Response,
     pagination: PaginationParams = Depends(),
     is_active: bool | None = Query(None, description="Filter by active status"),
     search: str | None = Query(None, description="Search by name, slug, description"),
+    include_total: bool = Query(
+        True,
+        description="Count matching items; false skips the COUNT and only reports has_next",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="next_cursor of the previous page; pages by keyset instead of offset and skips the COUNT",
+    ),
     admin: User = Depends(require_superuser),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
-    """List all organizations with filtering and search."""
+    """
+    List all organizations with filtering and search.
+
+    Responses with an exact total carry an ETag and answer 304 Not Modified
+    when If-None-Match matches it.
+    """
     try:
+        list_kwargs = {
+            "skip": pagination.offset,
+            "limit": pagination.limit,
+            "is_active": is_active,
+            "search": search,
+        }
+
+        after = _parse_cursor(cursor)
+        if after is not None:
+            list_kwargs["skip"] = 0
+
+        # An unfiltered count over a large table comes from planner statistics
+        estimate: int | None = None
+        if include_total and after is None and is_active is None and not search:
+            estimate = await organization_service.estimate_count(db)
+
         # Use optimized method that gets member counts in single query (no N+1)
-        orgs_with_data, total = await organization_service.get_multi_with_member_counts(
-            db,
-            skip=pagination.offset,
-            limit=pagination.limit,
-            is_active=is_active,
-            search=search,
-        )
+        total: int | None = None
+        has_next: bool | None = None
+        if include_total and after is None and estimate is None:
+            # Only the exact-count path pays for the change marker's scans
+            etag = make_list_etag(
+                request, *await organization_service.get_change_marker(db)
+            )
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = CACHE_CONTROL
 
-        # Build response objects from optimized query results
-        orgs_with_count = []
-        for item in orgs_with_data:
-            org = item["organization"]
-            member_count = item["member_count"]
-
-            org_dict = {
-                "id": org.id,
-                "name": org.name,
-                "slug": org.slug,
-                "description": org.description,
-                "is_active": org.is_active,
-                "settings": org.settings,
-                "created_at": org.created_at,
-                "updated_at": org.updated_at,
-                "member_count": member_count,
-            }
-            orgs_with_count.append(OrganizationResponse(**org_dict))
+            orgs, total = await organization_service.get_multi_with_member_counts(
+                db, **list_kwargs
+            )
+        else:
+            orgs, has_next = await organization_service.list_organizations_page(
+                db, after=after, **list_kwargs
+            )
+            total = estimate
+
+        # member_count is loaded onto each organization, so validate directly
+        orgs_with_count = organizations_adapter.validate_python(orgs)
 
         pagination_meta = create_pagination_meta(
             total=total,
             page=pagination.page,
             limit=pagination.limit,
             items_count=len(orgs_with_count),
+            has_next=has_next,
         )
+        pagination_meta.is_estimate = estimate is not None
+        if pagination_meta.has_next and orgs:
+            pagination_meta.next_cursor = encode_cursor(
+                orgs[-1].created_at, orgs[-1].id
+            )
 
         return PaginatedResponse(data=orgs_with_count, pagination=pagination_meta)
 
@@ -627,19 +820,8 @@ async def admin_create_organization(
         org = await organization_service.create_organization(db, obj_in=org_in)
         logger.info("Admin %s created organization %s", admin.email, org.name)
 
-        # Add member count
-        org_dict = {
-            "id": org.id,
-            "name": org.name,
-            "slug": org.slug,
-            "description": org.description,
-            "is_active": org.is_active,
-            "settings": org.settings,
-            "created_at": org.created_at,
-            "updated_at": org.updated_at,
-            "member_count": 0,
-        }
-        return OrganizationResponse(**org_dict)
+        # A new organization has no members yet
+        return OrganizationResponse.from_org(org)
 
     except DuplicateEntryError as e:
         logger.warning("Failed to create organization: %s", e)
@@ -662,21 +844,8 @@ async def admin_get_organization(
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """Get detailed information about a specific organization."""
-    org = await organization_service.get_organization(db, str(org_id))
-    org_dict = {
-        "id": org.id,
-        "name": org.name,
-        "slug": org.slug,
-        "description": org.description,
-        "is_active": org.is_active,
-        "settings": org.settings,
-        "created_at": org.created_at,
-        "updated_at": org.updated_at,
-        "member_count": await organization_service.get_member_count(
-            db, organization_id=org.id
-        ),
-    }
-    return OrganizationResponse(**org_dict)
+    org = await organization_service.get_org_with_member_count(db, org_id)
+    return OrganizationResponse.from_org(org)
 
 
 @router.put(
@@ -694,26 +863,14 @@ async def admin_update_organization(
 ) -> Any:
     """Update organization information."""
     try:
-        org = await organization_service.get_organization(db, str(org_id))
+        # The refresh after the update reloads member_count along with the row
+        org = await organization_service.get_org_with_member_count(db, org_id)
         updated_org = await organization_service.update_organization(
             db, org=org, obj_in=org_in
         )
         logger.info("Admin %s updated organization %s", admin.email, updated_org.name)
 
-        org_dict = {
-            "id": updated_org.id,
-            "name": updated_org.name,
-            "slug": updated_org.slug,
-            "description": updated_org.description,
-            "is_active": updated_org.is_active,
-            "settings": updated_org.settings,
-            "created_at": updated_org.created_at,
-            "updated_at": updated_org.updated_at,
-            "member_count": await organization_service.get_member_count(
-                db, organization_id=updated_org.id
-            ),
-        }
-        return OrganizationResponse(**org_dict)
+        return OrganizationResponse.from_org(updated_org)
 
     except Exception as e:
         logger.exception("Error updating organization (admin): %s", e)
@@ -773,7 +930,7 @@ async def admin_list_organization_members(
         )
 
         # Convert to response models
-        member_responses = [OrganizationMemberResponse(**member) for member in members]
+        member_responses = organization_members_adapter.validate_python(members)
 
         pagination_meta = create_pagination_meta(
             total=total,
@@ -815,8 +972,9 @@ async def admin_add_organization_member(
 ) -> Any:
     """Add a user to an organization."""
     try:
-        org = await organization_service.get_organization(db, str(org_id))
-        user = await user_service.get_user(db, str(request.user_id))
+        org_name, user_email = await organization_service.get_org_name_and_user_email(
+            db, org_id=org_id, user_id=request.user_id
+        )
 
         await organization_service.add_member(
             db, organization_id=org_id, user_id=request.user_id, role=request.role
@@ -825,13 +983,13 @@ async def admin_add_organization_member(
         logger.info(
             "Admin %s added user %s to organization %s with role %s",
             admin.email,
-            user.email,
-            org.name,
+            user_email,
+            org_name,
             request.role.value,
         )
 
         return MessageResponse(
-            success=True, message=f"User {user.email} added to organization {org.name}"
+            success=True, message=f"User {user_email} added to organization {org_name}"
         )
 
     except DuplicateEntryError as e:
@@ -859,8 +1017,9 @@ async def admin_remove_organization_member(
 ) -> Any:
     """Remove a user from an organization."""
     try:
-        org = await organization_service.get_organization(db, str(org_id))
-        user = await user_service.get_user(db, str(user_id))
+        org_name, user_email = await organization_service.get_org_name_and_user_email(
+            db, org_id=org_id, user_id=user_id
+        )
 
         success = await organization_service.remove_member(
             db, organization_id=org_id, user_id=user_id
@@ -875,13 +1034,13 @@ async def admin_remove_organization_member(
         logger.info(
             "Admin %s removed user %s from organization %s",
             admin.email,
-            user.email,
-            org.name,
+            user_email,
+            org_name,
         )
 
         return MessageResponse(
             success=True,
-            message=f"User {user.email} removed from organization {org.name}",
+            message=f"User {user_email} removed from organization {org_name}",
         )
 
     except NotFoundError:
@@ -916,44 +1075,14 @@ async def admin_list_sessions(
 ) -> Any:
     """List all sessions across all users with filtering and pagination."""
     try:
-        # Get sessions with user info (eager loaded to prevent N+1)
-        sessions, total = await session_service.get_all_sessions(
+        # Owner email and full name are projected in SQL: no ORM objects loaded
+        rows, total = await session_service.get_all_sessions_with_user(
             db,
             skip=pagination.offset,
             limit=pagination.limit,
             active_only=is_active if is_active is not None else True,
-            with_user=True,
         )
-
-        # Build response objects with user information
-        session_responses = []
-        for session in sessions:
-            # Get user full name
-            user_full_name = None
-            if session.user.first_name or session.user.last_name:
-                parts = []
-                if session.user.first_name:
-                    parts.append(session.user.first_name)
-                if session.user.last_name:
-                    parts.append(session.user.last_name)
-                user_full_name = " ".join(parts)
-
-            session_response = AdminSessionResponse(
-                id=session.id,
-                user_id=session.user_id,
-                user_email=session.user.email,
-                user_full_name=user_full_name,
-                device_name=session.device_name,
-                device_id=session.device_id,
-                ip_address=session.ip_address,
-                location_city=session.location_city,
-                location_country=session.location_country,
-                last_used_at=session.last_used_at,
-                created_at=session.created_at,
-                expires_at=session.expires_at,
-                is_active=session.is_active,
-            )
-            session_responses.append(session_response)
+        session_responses = admin_sessions_adapter.validate_python(rows)
 
         logger.info(
             "Admin %s listed %s sessions (total: %s)",
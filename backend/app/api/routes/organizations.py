@@ -25,6 +25,8 @@ from app.schemas.organizations import (
     OrganizationMemberResponse,
     OrganizationResponse,
     OrganizationUpdate,
+    organization_members_adapter,
+    organizations_adapter,
 )
 from app.services.organization_service import organization_service
 
@@ -57,24 +59,10 @@ async def get_my_organizations(
             db, user_id=current_user.id, is_active=is_active
         )
 
-        # Transform to response objects
-        orgs_with_data = []
-        for item in orgs_data:
-            org = item["organization"]
-            org_dict = {
-                "id": org.id,
-                "name": org.name,
-                "slug": org.slug,
-                "description": org.description,
-                "is_active": org.is_active,
-                "settings": org.settings,
-                "created_at": org.created_at,
-                "updated_at": org.updated_at,
-                "member_count": item["member_count"],
-            }
-            orgs_with_data.append(OrganizationResponse(**org_dict))
-
-        return orgs_with_data
+        # member_count is loaded onto each organization, so validate in one call
+        return organizations_adapter.validate_python(
+            [item["organization"] for item in orgs_data]
+        )
 
     except Exception as e:
         logger.exception("Error getting user organizations: %s", e)
@@ -99,21 +87,8 @@ async def get_organization(
     User must be a member of the organization.
     """
     try:
-        org = await organization_service.get_organization(db, str(organization_id))
-        org_dict = {
-            "id": org.id,
-            "name": org.name,
-            "slug": org.slug,
-            "description": org.description,
-            "is_active": org.is_active,
-            "settings": org.settings,
-            "created_at": org.created_at,
-            "updated_at": org.updated_at,
-            "member_count": await organization_service.get_member_count(
-                db, organization_id=org.id
-            ),
-        }
-        return OrganizationResponse(**org_dict)
+        org = await organization_service.get_org_with_member_count(db, organization_id)
+        return OrganizationResponse.from_org(org)
 
     except Exception as e:
         logger.exception("Error getting organization: %s", e)
@@ -148,7 +123,7 @@ async def get_organization_members(
             is_active=is_active,
         )
 
-        member_responses = [OrganizationMemberResponse(**member) for member in members]
+        member_responses = organization_members_adapter.validate_python(members)
 
         pagination_meta = create_pagination_meta(
             total=total,
@@ -183,7 +158,8 @@ async def update_organization(
     Requires owner or admin role in the organization.
     """
     try:
-        org = await organization_service.get_organization(db, str(organization_id))
+        # The refresh after the update reloads member_count along with the row
+        org = await organization_service.get_org_with_member_count(db, organization_id)
         updated_org = await organization_service.update_organization(
             db, org=org, obj_in=org_in
         )
@@ -191,20 +167,7 @@ async def update_organization(
             "User %s updated organization %s", current_user.email, updated_org.name
         )
 
-        org_dict = {
-            "id": updated_org.id,
-            "name": updated_org.name,
-            "slug": updated_org.slug,
-            "description": updated_org.description,
-            "is_active": updated_org.is_active,
-            "settings": updated_org.settings,
-            "created_at": updated_org.created_at,
-            "updated_at": updated_org.updated_at,
-            "member_count": await organization_service.get_member_count(
-                db, organization_id=updated_org.id
-            ),
-        }
-        return OrganizationResponse(**org_dict)
+        return OrganizationResponse.from_org(updated_org)
 
     except Exception as e:
         logger.exception("Error updating organization: %s", e)
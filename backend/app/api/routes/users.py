@@ -22,7 +22,7 @@ from app.schemas.common import (
     SortParams,
     create_pagination_meta,
 )
-from app.schemas.users import PasswordChange, UserResponse, UserUpdate
+from app.schemas.users import PasswordChange, UserResponse, UserUpdate, users_adapter
 from app.services.auth_service import AuthenticationError, AuthService
 from app.services.user_service import user_service
 
@@ -88,7 +88,9 @@ async def list_users(
             items_count=len(users),
         )
 
-        return PaginatedResponse(data=users, pagination=pagination_meta)
+        return PaginatedResponse(
+            data=users_adapter.validate_python(users), pagination=pagination_meta
+        )
     except Exception as e:
         logger.exception("Error listing users: %s", e)
         raise
@@ -1,4 +1,5 @@
 import asyncio
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
 from functools import partial
@@ -13,9 +14,17 @@ from jwt.exceptions import (
 )
 from pydantic import ValidationError
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.schemas.users import TokenData, TokenPayload
 
+# Claims of recently verified tokens, keyed by the raw token string, so a
+# bearer token sent with every request is only decoded and verified once.
+# Each entry expires no later than its token.
+_token_data_cache = TTLCache(
+    maxsize=4096, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
 
 # Custom exceptions for auth
 class AuthError(Exception):
@@ -226,14 +235,23 @@ def get_token_data(token: str) -> TokenData:
     """
     Extract the user ID and superuser status from a token.
 
+    Repeat calls with a token that was already verified are answered from
+    memory until the token expires; failed verifications are never cached.
+
     Args:
         token: JWT token
 
     Returns:
         TokenData with user_id and is_superuser
     """
+    token_data = _token_data_cache.get(token)
+    if token_data is not None:
+        return token_data
+
     payload = decode_token(token)
     user_id = payload.sub
     is_superuser = payload.is_superuser or False
 
-    return TokenData(user_id=uuid.UUID(user_id), is_superuser=is_superuser)
+    token_data = TokenData(user_id=uuid.UUID(user_id), is_superuser=is_superuser)
+    _token_data_cache.set(token, token_data, ttl=payload.exp - time.time())
+    return token_data
@@ -0,0 +1,157 @@
+"""
+Small in-process caches for hot read paths.
+
+Entries live in the memory of a single worker process: other workers keep
+their own copies, so cached values must be short-lived and invalidated
+locally on writes.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, ORMExecuteState, Session
+
+_MISSING = object()
+
+# Stale-key marker that evicts every entry of a cache
+ALL_KEYS = object()
+
+
+class TTLCache:
+    """
+    Bounded LRU mapping whose entries expire ``ttl`` seconds after insertion.
+
+    A ``ttl`` of 0 disables the cache: ``set`` stores nothing and every
+    ``get`` misses. Not thread-safe; meant for use from the event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether ``set`` stores anything."""
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for ``key``, or ``default`` if missing/expired."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Store ``value`` under ``key``, evicting the least recently used entry.
+
+        ``ttl`` can shorten the lifetime of this one entry, e.g. to the
+        validity left on a cached credential; an entry never outlives the
+        cache's own ``ttl``.
+        """
+        if not self.enabled:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop ``key`` if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class InvalidatingTTLCache(TTLCache):
+    """
+    TTLCache whose entries are evicted by ORM writes to the cached rows.
+
+    ``stale_keys`` maps a flushed session to the keys its pending changes
+    make stale, or ``ALL_KEYS``. Bulk UPDATE/DELETE statements against any of
+    ``bulk_mappers`` clear the whole cache, since their rows aren't known.
+    Stale keys are evicted at flush and again once the writing transaction
+    commits: a request running concurrently may have re-cached the old row in
+    between. Writes seen while the cache is disabled are ignored.
+
+    Only writes through this process's sessions are seen. Entries changed by
+    another worker stay stale until they expire, so the ttl bounds how long a
+    change can go unnoticed.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        *,
+        stale_keys: Callable[[Session], Iterable[Hashable]],
+        bulk_mappers: Iterable[Mapper[Any]] = (),
+    ):
+        super().__init__(maxsize, ttl)
+        self.stale_keys = stale_keys
+        self.bulk_mappers = frozenset(bulk_mappers)
+        _invalidating_caches.append(self)
+        if not event.contains(Session, "after_flush", _evict_flushed):
+            event.listen(Session, "after_flush", _evict_flushed)
+            event.listen(Session, "do_orm_execute", _evict_bulk_written)
+            event.listen(Session, "after_commit", _evict_committed)
+            event.listen(Session, "after_soft_rollback", _forget_rolled_back)
+
+    def evict(self, key: Hashable) -> None:
+        """Drop ``key``, or every entry for ``ALL_KEYS``."""
+        if key is ALL_KEYS:
+            self.clear()
+        else:
+            self.pop(key)
+
+
+_invalidating_caches: list[InvalidatingTTLCache] = []
+_STALE_KEYS = "invalidating_cache_stale_keys"
+
+
+def _mark_stale(session: Session, cache: InvalidatingTTLCache, key: Hashable) -> None:
+    """Evict a key now and remember it for eviction after commit."""
+    cache.evict(key)
+    session.info.setdefault(_STALE_KEYS, {}).setdefault(cache, set()).add(key)
+
+
+def _evict_flushed(session: Session, flush_context: Any) -> None:
+    for cache in _invalidating_caches:
+        if cache.enabled:
+            for key in cache.stale_keys(session):
+                _mark_stale(session, cache, key)
+
+
+def _evict_bulk_written(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    for cache in _invalidating_caches:
+        if cache.enabled and orm_execute_state.bind_mapper in cache.bulk_mappers:
+            _mark_stale(orm_execute_state.session, cache, ALL_KEYS)
+
+
+def _evict_committed(session: Session) -> None:
+    for cache, keys in session.info.pop(_STALE_KEYS, {}).items():
+        for key in keys:
+            cache.evict(key)
+
+
+def _forget_rolled_back(session: Session, previous_transaction: Any) -> None:
+    session.info.pop(_STALE_KEYS, None)
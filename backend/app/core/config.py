@@ -38,6 +38,11 @@ class Settings(BaseSettings):
     db_max_overflow: int = 50  # Maximum overflow connections
     db_pool_timeout: int = 30  # Seconds to wait for a connection
     db_pool_recycle: int = 3600  # Recycle connections after 1 hour
+    db_pool_use_lifo: bool = True  # Reuse the most recently returned connection
+    db_query_cache_size: int = 1200  # Compiled SQL statements cached per engine
+    # Unfiltered admin organization lists over tables with at least this many
+    # rows report PostgreSQL's planner estimate instead of COUNT(*) (0 disables)
+    db_count_estimate_min_rows: int = 100_000
 
     # SQL debugging (disable in production)
     sql_echo: bool = False  # Log SQL statements
@@ -67,6 +72,21 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15  # 15 minutes (production standard)
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7  # 7 days
 
+    # Per-worker cache of authenticated users, off by default (0). Opting in
+    # trades freshness for a query per request: a deactivation or password
+    # change made through another worker takes up to this long to be seen,
+    # so keep it well below the access token lifetime.
+    AUTH_USER_CACHE_TTL_SECONDS: int = 0
+    AUTH_USER_CACHE_MAXSIZE: int = 10_000
+
+    # Per-worker cache of organization roles (0 disables). A role change or
+    # removal made through another worker takes up to this long to be seen.
+    ORG_ROLE_CACHE_TTL_SECONDS: int = 5
+    ORG_ROLE_CACHE_MAXSIZE: int = 4096
+
+    # Per-worker cache of the admin dashboard stats (0 disables)
+    ADMIN_STATS_CACHE_TTL_SECONDS: int = 60
+
     # CORS configuration
     BACKEND_CORS_ORIGINS: list[str] = ["http://localhost:3000"]
 
@@ -20,6 +20,7 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import QueuePool
 
 from app.core.config import settings
 
@@ -69,6 +70,10 @@ def create_async_production_engine() -> AsyncEngine:
         "pool_timeout": settings.db_pool_timeout,
         "pool_recycle": settings.db_pool_recycle,
         "pool_pre_ping": True,
+        # LIFO lets idle connections beyond the working set reach
+        # pool_recycle and close, instead of rotating through all of them
+        "pool_use_lifo": settings.db_pool_use_lifo,
+        "query_cache_size": settings.db_query_cache_size,
         "echo": settings.sql_echo,
         "echo_pool": settings.sql_echo_pool,
     }
@@ -99,6 +104,26 @@ SessionLocal = async_sessionmaker(
 )
 
 
+def get_pool_stats() -> dict[str, int] | None:
+    """
+    Get a snapshot of the engine's connection pool usage.
+
+    Returns None for pools that do not queue connections (e.g. SQLite's
+    StaticPool in tests).
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return None
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        # Negative until the pool has opened pool_size connections
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.db_max_overflow,
+    }
+
+
 # FastAPI dependency for async database sessions
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
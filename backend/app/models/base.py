@@ -1,8 +1,10 @@
+import ipaddress
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, LargeBinary, String
+from sqlalchemy.dialects.postgresql import INET, UUID
+from sqlalchemy.types import TypeDecorator
 
 # noinspection PyUnresolvedReferences
 from app.core.database import Base  # Re-exported for other models
@@ -26,3 +28,51 @@ class UUIDMixin:
     """Mixin to add UUID primary keys to models"""
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+
+class HexDigest(TypeDecorator):
+    """
+    Hex-encoded digest stored as raw bytes (bytea).
+
+    Python code keeps working with hex strings (e.g. hashlib's hexdigest()),
+    while the column and its indexes hold half the bytes and compare them
+    byte-wise instead of through a text collation.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else bytes.fromhex(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else value.hex()
+
+
+class IPAddress(TypeDecorator):
+    """
+    IP address stored as PostgreSQL INET (7 or 19 bytes instead of up to 45
+    characters of text), falling back to a string column on other backends.
+
+    Values that aren't valid IPv4/IPv6 addresses (e.g. a proxy placeholder
+    like "unknown") are stored as NULL rather than rejected by the database.
+    """
+
+    impl = String(45)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(INET())
+        return dialect.type_descriptor(String(45))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return str(ipaddress.ip_address(value))
+        except ValueError:
+            return None
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else str(value)
@@ -6,7 +6,7 @@ from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from .base import Base, TimestampMixin, UUIDMixin
+from .base import Base, HexDigest, IPAddress, TimestampMixin, UUIDMixin
 
 
 class OAuthProviderRefreshToken(Base, UUIDMixin, TimestampMixin):
@@ -28,15 +28,16 @@ class OAuthProviderRefreshToken(Base, UUIDMixin, TimestampMixin):
     - Track last used time for security auditing
     - Support revocation by user, client, or admin
 
-    Performance indexes (defined in migration 0002_add_performance_indexes.py):
-    - ix_perf_oauth_refresh_tokens_expires: expires_at WHERE revoked = false
+    Performance indexes (defined in migrations, excluded from autogenerate):
+    - ix_perf_oauth_refresh_tokens_expires: expires_at WHERE revoked = false (0002)
+    - ix_perf_oauth_refresh_tokens_user_active: user_id WHERE revoked = false (0010)
     """
 
     __tablename__ = "oauth_provider_refresh_tokens"
 
-    # Hash of the refresh token (SHA-256)
+    # Hash of the refresh token (SHA-256, hex in Python, 32 raw bytes in the DB)
     # We store hash, not plaintext, for security
-    token_hash = Column(String(64), unique=True, nullable=False, index=True)
+    token_hash = Column(HexDigest(32), unique=True, nullable=False, index=True)
 
     # Unique token ID (JTI) - used in JWT access tokens to reference this refresh token
     jti = Column(String(64), unique=True, nullable=False, index=True)
@@ -62,14 +63,14 @@ class OAuthProviderRefreshToken(Base, UUIDMixin, TimestampMixin):
     expires_at = Column(DateTime(timezone=True), nullable=False)
 
     # Revocation flag
-    revoked = Column(Boolean, default=False, nullable=False, index=True)
+    revoked = Column(Boolean, default=False, nullable=False)
 
     # Last used timestamp (for security auditing)
     last_used_at = Column(DateTime(timezone=True), nullable=True)
 
     # Device/session info (optional, for user visibility)
     device_info = Column(String(500), nullable=True)
-    ip_address = Column(String(45), nullable=True)
+    ip_address = Column(IPAddress(), nullable=True)
 
     # Relationships
     client = relationship("OAuthClient", backref="refresh_tokens")
@@ -79,11 +80,6 @@ class OAuthProviderRefreshToken(Base, UUIDMixin, TimestampMixin):
     __table_args__ = (
         Index("ix_oauth_provider_refresh_tokens_expires_at", "expires_at"),
         Index("ix_oauth_provider_refresh_tokens_client_user", "client_id", "user_id"),
-        Index(
-            "ix_oauth_provider_refresh_tokens_user_revoked",
-            "user_id",
-            "revoked",
-        ),
     )
 
     def __repr__(self):
@@ -1,7 +1,7 @@
 # app/models/organization.py
 from sqlalchemy import Boolean, Column, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 
 from .base import Base, TimestampMixin, UUIDMixin
 
@@ -11,8 +11,10 @@ class Organization(Base, UUIDMixin, TimestampMixin):
     Organization model for multi-tenant support.
     Users can belong to multiple organizations with different roles.
 
-    Performance indexes (defined in migration 0002_add_performance_indexes.py):
-    - ix_perf_organizations_slug_lower: LOWER(slug) WHERE is_active = true
+    Performance indexes (defined in migrations, excluded from autogenerate):
+    - ix_perf_organizations_slug_lower: LOWER(slug) WHERE is_active = true (0002)
+    - ix_perf_organizations_{name,slug,description}_trgm: GIN trigram,
+      for ILIKE search (0004)
     """
 
     __tablename__ = "organizations"
@@ -23,6 +25,10 @@ class Organization(Base, UUIDMixin, TimestampMixin):
     is_active = Column(Boolean, default=True, nullable=False, index=True)
     settings = Column(JSONB, default={})
 
+    # Active member count, filled in only by queries that load it through
+    # with_expression(); None on organizations loaded any other way
+    member_count = query_expression()
+
     # Relationships
     user_organizations = relationship(
         "UserOrganization", back_populates="organization", cascade="all, delete-orphan"
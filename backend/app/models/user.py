@@ -9,9 +9,14 @@ class User(Base, UUIDMixin, TimestampMixin):
     """
     User model for authentication and profile data.
 
-    Performance indexes (defined in migration 0002_add_performance_indexes.py):
-    - ix_perf_users_email_lower: LOWER(email) WHERE deleted_at IS NULL
-    - ix_perf_users_active: is_active WHERE deleted_at IS NULL
+    Performance indexes (defined in migrations, excluded from autogenerate):
+    - ix_perf_users_email_lower: LOWER(email) WHERE deleted_at IS NULL (0002)
+    - ix_perf_users_superusers: id WHERE is_superuser AND deleted_at IS NULL (0009)
+    - ix_perf_users_inactive: id WHERE NOT is_active AND deleted_at IS NULL (0009)
+    - ix_perf_users_created_at: created_at INCLUDE (is_active), for dashboard
+      registration buckets and the admin list's created_at sort (0014)
+    - ix_perf_users_fulltext_trgm: GIN trigram on LOWER(email || first_name ||
+      last_name) WHERE deleted_at IS NULL, for ILIKE search (0005)
     """
 
     __tablename__ = "users"
@@ -22,8 +27,8 @@ class User(Base, UUIDMixin, TimestampMixin):
     first_name = Column(String(100), nullable=False, default="user")
     last_name = Column(String(100), nullable=True)
     phone_number = Column(String(20))
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
-    is_superuser = Column(Boolean, default=False, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
+    is_superuser = Column(Boolean, default=False, nullable=False)
     preferences = Column(JSONB)
     locale = Column(String(10), nullable=True, index=True)
     deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
@@ -1,5 +1,5 @@
 # app/models/user_organization.py
-from enum import Enum as PyEnum
+from enum import StrEnum
 
 from sqlalchemy import Boolean, Column, Enum, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -8,7 +8,7 @@ from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin
 
 
-class OrganizationRole(str, PyEnum):
+class OrganizationRole(StrEnum):
     """
     Built-in organization roles.
     These provide a baseline role system that can be optionally used.
@@ -25,6 +25,9 @@ class UserOrganization(Base, TimestampMixin):
     """
     Junction table for many-to-many relationship between Users and Organizations.
     Includes role information for flexible RBAC.
+
+    Lookups by user go through the (user_id, organization_id) primary key;
+    lookups by organization through ix_user_org_org_active.
     """
 
     __tablename__ = "user_organizations"
@@ -44,9 +47,8 @@ class UserOrganization(Base, TimestampMixin):
         Enum(OrganizationRole),
         default=OrganizationRole.MEMBER,
         nullable=False,
-        # Note: index defined in __table_args__ as ix_user_org_role
     )
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
 
     # Optional: Custom permissions override for specific users
     custom_permissions = Column(
@@ -57,11 +59,7 @@ class UserOrganization(Base, TimestampMixin):
     user = relationship("User", back_populates="user_organizations")
     organization = relationship("Organization", back_populates="user_organizations")
 
-    __table_args__ = (
-        Index("ix_user_org_user_active", "user_id", "is_active"),
-        Index("ix_user_org_org_active", "organization_id", "is_active"),
-        Index("ix_user_org_role", "role"),
-    )
+    __table_args__ = (Index("ix_user_org_org_active", "organization_id", "is_active"),)
 
     def __repr__(self):
         return f"<UserOrganization user={self.user_id} org={self.organization_id} role={self.role}>"
@@ -23,8 +23,14 @@ class UserSession(Base, UUIDMixin, TimestampMixin):
     Each time a user logs in from a device, a new session is created.
     Sessions are identified by the refresh token JTI (JWT ID).
 
-    Performance indexes (defined in migration 0002_add_performance_indexes.py):
-    - ix_perf_user_sessions_expires: expires_at WHERE is_active = true
+    Performance indexes (defined in migrations, excluded from autogenerate):
+    - ix_perf_user_sessions_expires: expires_at WHERE is_active = true (0002)
+    - ix_perf_user_sessions_created_brin: BRIN on created_at, for the
+      cleanup sweep (0006)
+    - ix_perf_user_sessions_user_last_used: (user_id, last_used_at DESC)
+      WHERE is_active = true (0008)
+    - ix_perf_user_sessions_active_last_used: last_used_at DESC
+      WHERE is_active = true, for the admin session list (0015)
     """
 
     __tablename__ = "user_sessions"
@@ -34,7 +40,6 @@ class UserSession(Base, UUIDMixin, TimestampMixin):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Refresh token identifier (JWT ID from the refresh token)
@@ -62,11 +67,10 @@ class UserSession(Base, UUIDMixin, TimestampMixin):
     # Relationship to user
     user = relationship("User", backref="sessions")
 
-    # Composite indexes for performance (defined in migration)
-    __table_args__ = (
-        Index("ix_user_sessions_user_active", "user_id", "is_active"),
-        Index("ix_user_sessions_jti_active", "refresh_token_jti", "is_active"),
-    )
+    # Composite indexes for performance (defined in migration).
+    # user_id lookups use the leading column of ix_user_sessions_user_active;
+    # JTI lookups use the unique refresh_token_jti index.
+    __table_args__ = (Index("ix_user_sessions_user_active", "user_id", "is_active"),)
 
     def __repr__(self):
         return f"<UserSession {self.device_name} ({self.ip_address})>"
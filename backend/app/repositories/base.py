@@ -12,7 +12,7 @@ from typing import Any, TypeVar
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 from sqlalchemy.exc import DataError, IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Load
@@ -318,6 +318,33 @@ class BaseRepository[
             logger.error("Error counting %s records: %s", self.model.__name__, e)
             raise
 
+    async def estimate_count(self, db: AsyncSession, *, min_rows: int) -> int | None:
+        """
+        Get the planner's row estimate for the model's table (PostgreSQL only).
+
+        Reads pg_class.reltuples, which costs the same at any table size but
+        only refreshes on ANALYZE/autovacuum. Returns None on other databases,
+        for tables never analyzed, and below ``min_rows``, where an exact count
+        is cheap anyway.
+        """
+        if min_rows <= 0 or db.get_bind().dialect.name != "postgresql":
+            return None
+        try:
+            result = await db.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class"
+                    " WHERE oid = to_regclass(:table_name)"
+                ),
+                {"table_name": self.model.__tablename__},
+            )
+            estimate = result.scalar_one_or_none()
+        except Exception as e:
+            logger.error("Error estimating %s row count: %s", self.model.__name__, e)
+            raise
+        if estimate is None or estimate < min_rows:
+            return None
+        return estimate
+
     async def exists(self, db: AsyncSession, id: str) -> bool:
         """Check if a record exists by ID."""
         obj = await self.get(db, id=id)
@@ -2,12 +2,25 @@
 """Repository for Organization model async database operations using SQLAlchemy 2.0 patterns."""
 
 import logging
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    bindparam,
+    case,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, with_expression
 
 from app.core.repository_exceptions import DuplicateEntryError, IntegrityConstraintError
 from app.models.organization import Organization
@@ -21,6 +34,25 @@ from app.schemas.organizations import (
 
 logger = logging.getLogger(__name__)
 
+# Role lookup runs on every org-scoped request; build the statement once so
+# each call only binds parameters and hits the compiled cache.
+_USER_ROLE_QUERY = select(UserOrganization.role).where(
+    and_(
+        UserOrganization.user_id == bindparam("user_id"),
+        UserOrganization.organization_id == bindparam("organization_id"),
+        UserOrganization.is_active,
+    )
+)
+
+
+def _organization_search_filter(search: str) -> ColumnElement[bool]:
+    """Match organizations whose name, slug or description contains ``search``."""
+    return or_(
+        Organization.name.ilike(f"%{search}%"),
+        Organization.slug.ilike(f"%{search}%"),
+        Organization.description.ilike(f"%{search}%"),
+    )
+
 
 class OrganizationRepository(
     BaseRepository[Organization, OrganizationCreate, OrganizationUpdate]
@@ -136,20 +168,103 @@ class OrganizationRepository(
             )
             raise
 
-    async def get_multi_with_member_counts(
-        self,
-        db: AsyncSession,
-        *,
-        skip: int = 0,
-        limit: int = 100,
-        is_active: bool | None = None,
-        search: str | None = None,
-    ) -> tuple[list[dict[str, Any]], int]:
-        """Get organizations with member counts in a SINGLE QUERY using JOIN and GROUP BY."""
+    async def get_with_member_count(
+        self, db: AsyncSession, *, organization_id: UUID
+    ) -> Organization | None:
+        """Get an organization with member_count set, in a single query."""
         try:
-            query = (
+            member_count = (
+                select(func.count(UserOrganization.user_id))
+                .where(
+                    and_(
+                        UserOrganization.organization_id == Organization.id,
+                        UserOrganization.is_active,
+                    )
+                )
+                .scalar_subquery()
+            )
+            result = await db.execute(
+                select(Organization)
+                .where(Organization.id == organization_id)
+                .options(with_expression(Organization.member_count, member_count))
+                # Apply the expression even if the row is already in the session
+                .execution_options(populate_existing=True)
+            )
+            return result.scalar_one_or_none()
+        except Exception as e:
+            logger.error(
+                "Error getting organization %s with member count: %s",
+                organization_id,
+                e,
+            )
+            raise
+
+    async def get_name_and_user_email(
+        self, db: AsyncSession, *, organization_id: UUID, user_id: UUID
+    ) -> tuple[str | None, str | None]:
+        """
+        Get an organization's name and a user's email in a single query.
+
+        Either value is None when that row does not exist.
+        """
+        try:
+            result = await db.execute(
+                select(
+                    select(Organization.name)
+                    .where(Organization.id == organization_id)
+                    .scalar_subquery(),
+                    select(User.email).where(User.id == user_id).scalar_subquery(),
+                )
+            )
+            org_name, user_email = result.one()
+            return org_name, user_email
+        except Exception as e:
+            logger.error(
+                "Error getting organization %s and user %s: %s",
+                organization_id,
+                user_id,
+                e,
+            )
+            raise
+
+    async def get_change_marker(
+        self, db: AsyncSession
+    ) -> tuple[int, datetime | None, int, datetime | None]:
+        """
+        Get row counts and latest updated_at of organizations and memberships.
+
+        Listings show member counts, so membership changes must move the
+        marker as well. Runs as one statement.
+        """
+        try:
+            result = await db.execute(
                 select(
-                    Organization,
+                    select(func.count(Organization.id)).scalar_subquery(),
+                    select(func.max(Organization.updated_at)).scalar_subquery(),
+                    select(func.count(UserOrganization.user_id)).scalar_subquery(),
+                    select(func.max(UserOrganization.updated_at)).scalar_subquery(),
+                )
+            )
+            org_count, org_updated, member_count, member_updated = result.one()
+            return org_count, org_updated, member_count, member_updated
+        except Exception as e:
+            logger.error("Error getting organization change marker: %s", e)
+            raise
+
+    def _member_counts_query(
+        self, *, is_active: bool | None, search: str | None
+    ) -> Select[Any]:
+        """Select organizations matching the list filters, with member_count set."""
+        query = (
+            select(Organization)
+            .outerjoin(
+                UserOrganization,
+                Organization.id == UserOrganization.organization_id,
+            )
+            .group_by(Organization.id)
+            .options(
+                with_expression(
+                    Organization.member_count,
                     func.count(
                         func.distinct(
                             case(
@@ -160,52 +275,111 @@ class OrganizationRepository(
                                 else_=None,
                             )
                         )
-                    ).label("member_count"),
-                )
-                .outerjoin(
-                    UserOrganization,
-                    Organization.id == UserOrganization.organization_id,
-                )
-                .group_by(Organization.id)
+                    ),
+                ),
+                # Callers only read columns; fail loudly on any lazy load
+                raiseload("*"),
             )
+        )
 
-            if is_active is not None:
-                query = query.where(Organization.is_active == is_active)
+        if is_active is not None:
+            query = query.where(Organization.is_active == is_active)
+        if search:
+            query = query.where(_organization_search_filter(search))
 
-            search_filter = None
-            if search:
-                search_filter = or_(
-                    Organization.name.ilike(f"%{search}%"),
-                    Organization.slug.ilike(f"%{search}%"),
-                    Organization.description.ilike(f"%{search}%"),
+        return query
+
+    async def _fetch_page(
+        self,
+        db: AsyncSession,
+        query: Select[Any],
+        *,
+        skip: int,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[Organization]:
+        """Fetch one newest-first page of a _member_counts_query."""
+        if after is not None:
+            query = query.where(
+                tuple_(Organization.created_at, Organization.id)
+                < tuple_(
+                    literal(after[0], Organization.created_at.type),
+                    literal(after[1], Organization.id.type),
                 )
-                query = query.where(search_filter)
+            )
+
+        # Tie-break on id so (created_at, id) cursors are exact
+        query = (
+            query.order_by(Organization.created_at.desc(), Organization.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
+        result = await db.execute(query)
+        return list(result.scalars().all())
 
+    async def get_multi_with_member_counts(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: bool | None = None,
+        search: str | None = None,
+    ) -> tuple[list[Organization], int]:
+        """
+        Get organizations with member counts in a SINGLE QUERY using JOIN and GROUP BY.
+
+        Each organization comes back with member_count set.
+        """
+        try:
             count_query = select(func.count(Organization.id))
             if is_active is not None:
                 count_query = count_query.where(Organization.is_active == is_active)
-            if search_filter is not None:
-                count_query = count_query.where(search_filter)
+            if search:
+                count_query = count_query.where(_organization_search_filter(search))
 
             count_result = await db.execute(count_query)
             total = count_result.scalar_one()
 
-            query = (
-                query.order_by(Organization.created_at.desc()).offset(skip).limit(limit)
+            orgs = await self._fetch_page(
+                db,
+                self._member_counts_query(is_active=is_active, search=search),
+                skip=skip,
+                limit=limit,
             )
+            return orgs, total
 
-            result = await db.execute(query)
-            rows = result.all()
-
-            orgs_with_counts = [
-                {"organization": org, "member_count": member_count}
-                for org, member_count in rows
-            ]
+        except Exception as e:
+            logger.exception("Error getting organizations with member counts: %s", e)
+            raise
 
-            return orgs_with_counts, total
+    async def get_multi_page_with_member_counts(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: bool | None = None,
+        search: str | None = None,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[Organization]:
+        """
+        Get one page like get_multi_with_member_counts, without counting them.
 
+        ``after`` is a (created_at, id) keyset cursor: only organizations
+        older than it are returned, without an OFFSET scan.
+        """
+        try:
+            return await self._fetch_page(
+                db,
+                self._member_counts_query(is_active=is_active, search=search),
+                skip=skip,
+                limit=limit,
+                after=after,
+            )
         except Exception as e:
-            logger.exception("Error getting organizations with member counts: %s", e)
+            logger.exception("Error getting organizations page: %s", e)
             raise
 
     async def add_user(
@@ -338,6 +512,7 @@ class OrganizationRepository(
                 select(UserOrganization, User)
                 .join(User, UserOrganization.user_id == User.id)
                 .where(UserOrganization.organization_id == organization_id)
+                .options(raiseload("*"))
             )
 
             if is_active is not None:
@@ -409,7 +584,11 @@ class OrganizationRepository(
     async def get_user_organizations_with_details(
         self, db: AsyncSession, *, user_id: UUID, is_active: bool | None = True
     ) -> list[dict[str, Any]]:
-        """Get user's organizations with role and member count in SINGLE QUERY."""
+        """
+        Get user's organizations with role and member count in SINGLE QUERY.
+
+        member_count is also loaded onto each Organization.
+        """
         try:
             member_count_subq = (
                 select(
@@ -422,12 +601,12 @@ class OrganizationRepository(
             )
 
             query = (
-                select(
-                    Organization,
-                    UserOrganization.role,
-                    func.coalesce(member_count_subq.c.member_count, 0).label(
-                        "member_count"
-                    ),
+                select(Organization, UserOrganization.role)
+                .options(
+                    with_expression(
+                        Organization.member_count,
+                        func.coalesce(member_count_subq.c.member_count, 0),
+                    )
                 )
                 .join(
                     UserOrganization,
@@ -447,8 +626,8 @@ class OrganizationRepository(
             rows = result.all()
 
             return [
-                {"organization": org, "role": role, "member_count": member_count}
-                for org, role, member_count in rows
+                {"organization": org, "role": role, "member_count": org.member_count}
+                for org, role in rows
             ]
 
         except Exception as e:
@@ -461,17 +640,10 @@ class OrganizationRepository(
         """Get a user's role in a specific organization."""
         try:
             result = await db.execute(
-                select(UserOrganization).where(
-                    and_(
-                        UserOrganization.user_id == user_id,
-                        UserOrganization.organization_id == organization_id,
-                        UserOrganization.is_active,
-                    )
-                )
+                _USER_ROLE_QUERY,
+                {"user_id": user_id, "organization_id": organization_id},
             )
-            user_org = result.scalar_one_or_none()
-
-            return user_org.role if user_org else None  # pyright: ignore[reportReturnType]
+            return result.scalar_one_or_none()
         except Exception as e:
             logger.error("Error getting user role in org: %s", e)
             raise
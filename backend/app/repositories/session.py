@@ -6,17 +6,29 @@ import uuid
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy import Row, and_, delete, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, raiseload
 
 from app.core.repository_exceptions import IntegrityConstraintError, InvalidInputError
+from app.models.user import User
 from app.models.user_session import UserSession
 from app.repositories.base import BaseRepository
 from app.schemas.sessions import SessionCreate, SessionUpdate
 
 logger = logging.getLogger(__name__)
 
+# "first last" with missing parts dropped; NULL when the user has neither.
+# Built from ||, COALESCE and TRIM so it also runs on SQLite.
+_USER_FULL_NAME = func.nullif(
+    func.trim(
+        func.coalesce(User.first_name, literal(""))
+        + literal(" ")
+        + func.coalesce(User.last_name, literal(""))
+    ),
+    literal(""),
+)
+
 
 class SessionRepository(BaseRepository[UserSession, SessionCreate, SessionUpdate]):
     """Repository for UserSession model."""
@@ -296,12 +308,18 @@ class SessionRepository(BaseRepository[UserSession, SessionCreate, SessionUpdate
         active_only: bool = True,
         with_user: bool = True,
     ) -> tuple[list[UserSession], int]:
-        """Get all sessions across all users with pagination (admin only)."""
+        """
+        Get all sessions across all users with pagination (admin only).
+
+        Relationships that are not eager-loaded here raise on access instead
+        of lazy-loading one row at a time.
+        """
         try:
             query = select(UserSession)
 
             if with_user:
                 query = query.options(joinedload(UserSession.user))
+            query = query.options(raiseload("*"))
 
             if active_only:
                 query = query.where(UserSession.is_active)
@@ -328,6 +346,58 @@ class SessionRepository(BaseRepository[UserSession, SessionCreate, SessionUpdate
             logger.exception("Error getting all sessions: %s", e)
             raise
 
+    async def get_all_sessions_with_user(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True,
+    ) -> tuple[list[Row], int]:
+        """
+        Get all sessions with their owner's email and name as flat rows (admin only).
+
+        Rows carry exactly the AdminSessionResponse fields, projected in SQL,
+        so no UserSession or User objects are loaded.
+        """
+        try:
+            query = select(
+                UserSession.id,
+                UserSession.user_id,
+                User.email.label("user_email"),
+                _USER_FULL_NAME.label("user_full_name"),
+                UserSession.device_name,
+                UserSession.device_id,
+                UserSession.ip_address,
+                UserSession.location_city,
+                UserSession.location_country,
+                UserSession.last_used_at,
+                UserSession.created_at,
+                UserSession.expires_at,
+                UserSession.is_active,
+            ).join(User, UserSession.user_id == User.id)
+
+            count_query = select(func.count(UserSession.id))
+            if active_only:
+                query = query.where(UserSession.is_active)
+                count_query = count_query.where(UserSession.is_active)
+
+            count_result = await db.execute(count_query)
+            total = count_result.scalar_one()
+
+            query = (
+                query.order_by(UserSession.last_used_at.desc())
+                .offset(skip)
+                .limit(limit)
+            )
+
+            result = await db.execute(query)
+            return list(result.all()), total
+
+        except Exception as e:
+            logger.exception("Error getting all sessions with user info: %s", e)
+            raise
+
 
 # Singleton instance
 session_repo = SessionRepository(UserSession)
@@ -6,7 +6,18 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import or_, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,6 +29,38 @@ from app.schemas.users import UserCreate, UserUpdate
 
 logger = logging.getLogger(__name__)
 
+# Concatenated search text, matching the ix_perf_users_fulltext_trgm GIN index
+# expression (migration 0005). Literals are inlined rather than bound so the
+# rendered expression is identical to the indexed one.
+_EMPTY = literal_column("''")
+_SPACE = literal_column("' '")
+_USER_SEARCH_TEXT = func.lower(
+    func.coalesce(User.email, _EMPTY)
+    + _SPACE
+    + func.coalesce(User.first_name, _EMPTY)
+    + _SPACE
+    + func.coalesce(User.last_name, _EMPTY)
+)
+
+
+def _user_search_filter(search: str) -> ColumnElement[bool]:
+    """
+    Match the search term inside the email, first name or last name.
+
+    The concatenated clause is the one the GIN index answers; the per-field
+    clauses only recheck its candidates, so a term spanning two fields
+    (the end of the email and the start of the first name) doesn't match.
+    """
+    pattern = f"%{search}%"
+    return and_(
+        _USER_SEARCH_TEXT.ilike(pattern),
+        or_(
+            User.email.ilike(pattern),
+            User.first_name.ilike(pattern),
+            User.last_name.ilike(pattern),
+        ),
+    )
+
 
 class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
     """Repository for User model."""
@@ -128,6 +171,57 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         await db.refresh(user)
         return user
 
+    def _list_query(
+        self, *, filters: dict[str, Any] | None, search: str | None
+    ) -> Select[Any]:
+        """Select live users matching the admin list filters and search."""
+        query = select(User).where(User.deleted_at.is_(None))
+
+        if filters:
+            for field, value in filters.items():
+                if hasattr(User, field) and value is not None:
+                    query = query.where(getattr(User, field) == value)
+
+        if search:
+            query = query.where(_user_search_filter(search))
+
+        return query
+
+    async def _fetch_page(
+        self,
+        db: AsyncSession,
+        query: Select[Any],
+        *,
+        skip: int,
+        limit: int,
+        sort_by: str | None,
+        sort_order: str,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[User]:
+        """Sort a _list_query, seek past ``after`` and fetch one page of it."""
+        descending = sort_order.lower() == "desc"
+        if after is not None:
+            key = tuple_(User.created_at, User.id)
+            bound = tuple_(
+                literal(after[0], User.created_at.type),
+                literal(after[1], User.id.type),
+            )
+            query = query.where(key < bound if descending else key > bound)
+
+        if sort_by and hasattr(User, sort_by):
+            sort_column = getattr(User, sort_by)
+            if descending:
+                query = query.order_by(sort_column.desc())
+            else:
+                query = query.order_by(sort_column.asc())
+            if sort_by == "created_at":
+                # Tie-break on id so (created_at, id) cursors are exact
+                query = query.order_by(User.id.desc() if descending else User.id.asc())
+
+        query = query.offset(skip).limit(limit)
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
     async def get_multi_with_total(
         self,
         db: AsyncSession,
@@ -148,68 +242,112 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             raise InvalidInputError("Maximum limit is 1000")
 
         try:
-            query = select(User)
-            query = query.where(User.deleted_at.is_(None))
-
-            if filters:
-                for field, value in filters.items():
-                    if hasattr(User, field) and value is not None:
-                        query = query.where(getattr(User, field) == value)
-
-            if search:
-                search_filter = or_(
-                    User.email.ilike(f"%{search}%"),
-                    User.first_name.ilike(f"%{search}%"),
-                    User.last_name.ilike(f"%{search}%"),
-                )
-                query = query.where(search_filter)
-
-            from sqlalchemy import func
+            query = self._list_query(filters=filters, search=search)
 
             count_query = select(func.count()).select_from(query.alias())
             count_result = await db.execute(count_query)
             total = count_result.scalar_one()
 
-            if sort_by and hasattr(User, sort_by):
-                sort_column = getattr(User, sort_by)
-                if sort_order.lower() == "desc":
-                    query = query.order_by(sort_column.desc())
-                else:
-                    query = query.order_by(sort_column.asc())
-
-            query = query.offset(skip).limit(limit)
-            result = await db.execute(query)
-            users = list(result.scalars().all())
-
+            users = await self._fetch_page(
+                db,
+                query,
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_order=sort_order,
+            )
             return users, total
 
         except Exception as e:
             logger.error("Error retrieving paginated users: %s", e)
             raise
 
+    async def get_multi_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        filters: dict[str, Any] | None = None,
+        search: str | None = None,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[User]:
+        """
+        Get one page of users like get_multi_with_total, without counting them.
+
+        ``after`` is a (created_at, id) keyset cursor: only users past it in
+        sort order are returned, so deep pages cost no OFFSET scan. It needs
+        sort_by="created_at".
+        """
+        if skip < 0:
+            raise InvalidInputError("skip must be non-negative")
+        if limit < 0:
+            raise InvalidInputError("limit must be non-negative")
+        if limit > 1000:
+            raise InvalidInputError("Maximum limit is 1000")
+        if after is not None and sort_by != "created_at":
+            raise InvalidInputError("Cursor pagination requires sort_by=created_at")
+
+        try:
+            return await self._fetch_page(
+                db,
+                self._list_query(filters=filters, search=search),
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                after=after,
+            )
+        except Exception as e:
+            logger.error("Error retrieving users page: %s", e)
+            raise
+
+    async def get_change_marker(self, db: AsyncSession) -> tuple[int, datetime | None]:
+        """
+        Get (row count, latest updated_at) over all users, soft-deleted included.
+
+        Every insert, update and delete changes one of the two, so the pair
+        can back an ETag for user listings.
+        """
+        try:
+            result = await db.execute(
+                select(func.count(User.id), func.max(User.updated_at))
+            )
+            count, last_updated = result.one()
+            return count, last_updated
+        except Exception as e:
+            logger.error("Error getting user change marker: %s", e)
+            raise
+
     async def bulk_update_status(
         self, db: AsyncSession, *, user_ids: list[UUID], is_active: bool
-    ) -> int:
-        """Bulk update is_active status for multiple users."""
+    ) -> list[UUID]:
+        """Bulk update is_active status for multiple users; returns the updated IDs."""
         try:
             if not user_ids:
-                return 0
+                return []
 
+            # No ORM sync: nothing reads the affected users back from this
+            # session, so skip matching the statement against the identity map
             stmt = (
                 update(User)
                 .where(User.id.in_(user_ids))
                 .where(User.deleted_at.is_(None))
                 .values(is_active=is_active, updated_at=datetime.now(UTC))
+                .returning(User.id)
+                .execution_options(synchronize_session=False)
             )
 
             result = await db.execute(stmt)
+            updated_ids = list(result.scalars())
             await db.commit()
 
-            updated_count = result.rowcount
             logger.info(
-                "Bulk updated %s users to is_active=%s", updated_count, is_active
+                "Bulk updated %s users to is_active=%s", len(updated_ids), is_active
             )
-            return updated_count
+            return updated_ids
 
         except Exception as e:
             await db.rollback()
@@ -222,34 +360,30 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         *,
         user_ids: list[UUID],
         exclude_user_id: UUID | None = None,
-    ) -> int:
-        """Bulk soft delete multiple users."""
+    ) -> list[UUID]:
+        """Bulk soft delete multiple users; returns the deleted IDs."""
         try:
             if not user_ids:
-                return 0
-
-            filtered_ids = [uid for uid in user_ids if uid != exclude_user_id]
-
-            if not filtered_ids:
-                return 0
+                return []
 
+            now = datetime.now(UTC)
             stmt = (
                 update(User)
-                .where(User.id.in_(filtered_ids))
+                .where(User.id.in_(user_ids))
                 .where(User.deleted_at.is_(None))
-                .values(
-                    deleted_at=datetime.now(UTC),
-                    is_active=False,
-                    updated_at=datetime.now(UTC),
-                )
+                .values(deleted_at=now, is_active=False, updated_at=now)
+                .returning(User.id)
+                .execution_options(synchronize_session=False)
             )
+            if exclude_user_id is not None:
+                stmt = stmt.where(User.id != exclude_user_id)
 
             result = await db.execute(stmt)
+            deleted_ids = list(result.scalars())
             await db.commit()
 
-            deleted_count = result.rowcount
-            logger.info("Bulk soft deleted %s users", deleted_count)
-            return deleted_count
+            logger.info("Bulk soft deleted %s users", len(deleted_ids))
+            return deleted_ids
 
         except Exception as e:
             await db.rollback()
@@ -2,6 +2,8 @@
 Common schemas used across the API for pagination, responses, filtering, and sorting.
 """
 
+import base64
+from datetime import datetime
 from enum import Enum
 from math import ceil
 from typing import TypeVar
@@ -58,12 +60,24 @@ class SortParams(BaseModel):
 class PaginationMeta(BaseModel):
     """Metadata for paginated responses."""
 
-    total: int = Field(..., description="Total number of items")
+    total: int | None = Field(
+        ..., description="Total number of items (null when the count was skipped)"
+    )
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of items in current page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: int | None = Field(
+        ..., description="Total number of pages (null when the count was skipped)"
+    )
     has_next: bool = Field(..., description="Whether there is a next page")
     has_prev: bool = Field(..., description="Whether there is a previous page")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page when the list supports keyset paging",
+    )
+    is_estimate: bool = Field(
+        default=False,
+        description="Whether total is an estimate rather than an exact count",
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -158,27 +172,75 @@ class BulkActionResponse(BaseModel):
 
 
 def create_pagination_meta(
-    total: int, page: int, limit: int, items_count: int
+    total: int | None,
+    page: int,
+    limit: int,
+    items_count: int,
+    has_next: bool | None = None,
 ) -> PaginationMeta:
     """
     Helper function to create pagination metadata.
 
     Args:
-        total: Total number of items
+        total: Total number of items, or None if the count was skipped
         page: Current page number
         limit: Items per page
         items_count: Number of items in current page
+        has_next: Whether a next page exists; required when total is None
 
     Returns:
         PaginationMeta object with calculated values
     """
-    total_pages = ceil(total / limit) if limit > 0 else 0
+    if total is None:
+        if has_next is None:
+            raise ValueError("has_next is required when total is None")
+        total_pages = None
+    else:
+        total_pages = ceil(total / limit) if limit > 0 else 0
+        if has_next is None:
+            has_next = page < total_pages
 
     return PaginationMeta(
         total=total,
         page=page,
         page_size=items_count,
         total_pages=total_pages,
-        has_next=page < total_pages,
+        has_next=has_next,
         has_prev=page > 1,
     )
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """
+    Encode a keyset pagination cursor for a row ordered by (created_at, id).
+
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        id: ID of the last row on the page
+
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        (created_at, id) of the row the next page starts after
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except ValueError as e:  # also covers binascii.Error and UnicodeDecodeError
+        raise ValueError("Malformed cursor") from e
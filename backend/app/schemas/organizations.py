@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 from app.models.user_organization import OrganizationRole
 
@@ -95,6 +95,20 @@ class OrganizationResponse(OrganizationBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_org(cls, org: Any) -> "OrganizationResponse":
+        """Build a response straight from an Organization row."""
+        response = cls.model_validate(org)
+        # member_count is only loaded on request; a row without it (such as a
+        # just-created organization) has no members yet
+        if response.member_count is None:
+            response.member_count = 0
+        return response
+
+
+# Validates a whole page of organizations (loaded with member_count) in one call
+organizations_adapter = TypeAdapter(list[OrganizationResponse])
+
 
 class OrganizationListResponse(BaseModel):
     """Schema for paginated organization list responses."""
@@ -159,6 +173,10 @@ class OrganizationMemberResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Validates a whole page of member rows in one pydantic-core call
+organization_members_adapter = TypeAdapter(list[OrganizationMemberResponse])
+
+
 class OrganizationMemberListResponse(BaseModel):
     """Schema for paginated organization member list."""
 
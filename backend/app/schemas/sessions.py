@@ -5,7 +5,7 @@ Pydantic schemas for user session management.
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class SessionBase(BaseModel):
@@ -159,6 +159,10 @@ class AdminSessionResponse(SessionBase):
     )
 
 
+# Validates a whole page of admin session rows in one pydantic-core call
+admin_sessions_adapter = TypeAdapter(list[AdminSessionResponse])
+
+
 class DeviceInfo(BaseModel):
     """Device information extracted from request."""
 
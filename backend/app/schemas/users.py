@@ -3,7 +3,14 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    TypeAdapter,
+    field_validator,
+)
 
 from app.schemas.validators import validate_password_strength, validate_phone_number
 
@@ -112,6 +119,10 @@ class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Validates a whole page of users in one pydantic-core call
+users_adapter = TypeAdapter(list[UserResponse])
+
+
 class Token(BaseModel):
     access_token: str
     refresh_token: str | None = None
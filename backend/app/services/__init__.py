@@ -1,7 +1,7 @@
 # app/services/__init__.py
 from . import oauth_provider_service
-from .auth_service import AuthService
-from .oauth_service import OAuthService
+from .auth_service import AuthService, auth_service
+from .oauth_service import OAuthService, oauth_service
 from .organization_service import OrganizationService, organization_service
 from .session_service import SessionService, session_service
 from .user_service import UserService, user_service
@@ -12,7 +12,9 @@ __all__ = [
     "OrganizationService",
     "SessionService",
     "UserService",
+    "auth_service",
     "oauth_provider_service",
+    "oauth_service",
     "organization_service",
     "session_service",
     "user_service",
@@ -241,3 +241,7 @@ class AuthService:
         user = await user_repo.update_password(db, user=user, password_hash=new_hash)
         logger.info("Password reset successfully for %s", email)
         return user
+
+
+# Default singleton
+auth_service = AuthService()
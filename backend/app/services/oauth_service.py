@@ -19,6 +19,7 @@ from typing import TypedDict, cast
 from uuid import UUID
 
 from authlib.integrations.httpx_client import AsyncOAuth2Client
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import create_access_token, create_refresh_token
@@ -694,6 +695,9 @@ class OAuthService:
         # Note: We query directly instead of using user.can_remove_oauth property
         # because the property uses lazy loading which doesn't work in async context
         user_id = cast(UUID, user.id)
+        if "password_hash" in inspect(user).unloaded:
+            # Users served from the auth cache never carry the password hash
+            await db.refresh(user, attribute_names=["password_hash"])
         has_password = user.password_hash is not None
         oauth_accounts = await oauth_account.get_user_accounts(db, user_id=user_id)
         can_remove = has_password or len(oauth_accounts) > 1
@@ -742,3 +746,7 @@ class OAuthService:
             Number of states cleaned up
         """
         return await oauth_state.cleanup_expired(db)
+
+
+# Default singleton
+oauth_service = OAuthService()
@@ -2,11 +2,13 @@
 """Service layer for organization operations — delegates to OrganizationRepository."""
 
 import logging
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.exceptions import NotFoundError
 from app.models.organization import Organization
 from app.models.user_organization import OrganizationRole, UserOrganization
@@ -31,6 +33,28 @@ class OrganizationService:
             raise NotFoundError(f"Organization {org_id} not found")
         return org
 
+    async def get_org_with_member_count(
+        self, db: AsyncSession, org_id: UUID
+    ) -> Organization:
+        """Get organization with member_count set, raising NotFoundError if not found."""
+        org = await self._repo.get_with_member_count(db, organization_id=org_id)
+        if not org:
+            raise NotFoundError(f"Organization {org_id} not found")
+        return org
+
+    async def get_org_name_and_user_email(
+        self, db: AsyncSession, *, org_id: UUID, user_id: UUID
+    ) -> tuple[str, str]:
+        """Get an organization's name and a user's email in one query, raising NotFoundError if either is missing."""
+        org_name, user_email = await self._repo.get_name_and_user_email(
+            db, organization_id=org_id, user_id=user_id
+        )
+        if org_name is None:
+            raise NotFoundError(f"Organization {org_id} not found")
+        if user_email is None:
+            raise NotFoundError(f"User {user_id} not found")
+        return org_name, user_email
+
     async def create_organization(
         self, db: AsyncSession, *, obj_in: OrganizationCreate
     ) -> Organization:
@@ -55,6 +79,18 @@ class OrganizationService:
         """Get number of active members in an organization."""
         return await self._repo.get_member_count(db, organization_id=organization_id)
 
+    async def get_change_marker(
+        self, db: AsyncSession
+    ) -> tuple[int, datetime | None, int, datetime | None]:
+        """Get counts and latest updated_at of organizations and memberships."""
+        return await self._repo.get_change_marker(db)
+
+    async def estimate_count(self, db: AsyncSession) -> int | None:
+        """Get the planner's organization count estimate for large tables, else None."""
+        return await self._repo.estimate_count(
+            db, min_rows=settings.db_count_estimate_min_rows
+        )
+
     async def get_multi_with_member_counts(
         self,
         db: AsyncSession,
@@ -63,12 +99,33 @@ class OrganizationService:
         limit: int = 100,
         is_active: bool | None = None,
         search: str | None = None,
-    ) -> tuple[list[dict[str, Any]], int]:
-        """List organizations with member counts and pagination."""
+    ) -> tuple[list[Organization], int]:
+        """List organizations, each with member_count set, and pagination."""
         return await self._repo.get_multi_with_member_counts(
             db, skip=skip, limit=limit, is_active=is_active, search=search
         )
 
+    async def list_organizations_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: bool | None = None,
+        search: str | None = None,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> tuple[list[Organization], bool]:
+        """List one page of organizations without counting them; returns (orgs, has_more)."""
+        orgs = await self._repo.get_multi_page_with_member_counts(
+            db,
+            skip=skip,
+            limit=limit + 1,
+            is_active=is_active,
+            search=search,
+            after=after,
+        )
+        return orgs[:limit], len(orgs) > limit
+
     async def get_user_organizations_with_details(
         self,
         db: AsyncSession,
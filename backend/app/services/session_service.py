@@ -4,6 +4,7 @@
 import logging
 from datetime import datetime
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user_session import UserSession
@@ -92,6 +93,19 @@ class SessionService:
             db, skip=skip, limit=limit, active_only=active_only, with_user=with_user
         )
 
+    async def get_all_sessions_with_user(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = True,
+    ) -> tuple[list[Row], int]:
+        """Get all sessions as flat rows with owner email and name (admin only)."""
+        return await self._repo.get_all_sessions_with_user(
+            db, skip=skip, limit=limit, active_only=active_only
+        )
+
 
 # Default singleton
 session_service = SessionService()
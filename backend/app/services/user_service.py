@@ -2,6 +2,8 @@
 """Service layer for user operations — delegates to UserRepository."""
 
 import logging
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
@@ -68,10 +70,39 @@ class UserService:
             search=search,
         )
 
+    async def list_users_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        filters: dict[str, Any] | None = None,
+        search: str | None = None,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> tuple[list[User], bool]:
+        """List one page of users without counting them; returns (users, has_more)."""
+        users = await self._repo.get_multi_page(
+            db,
+            skip=skip,
+            limit=limit + 1,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            filters=filters,
+            search=search,
+            after=after,
+        )
+        return users[:limit], len(users) > limit
+
+    async def get_change_marker(self, db: AsyncSession) -> tuple[int, datetime | None]:
+        """Get a (count, latest updated_at) pair that changes with any user write."""
+        return await self._repo.get_change_marker(db)
+
     async def bulk_update_status(
         self, db: AsyncSession, *, user_ids: list[UUID], is_active: bool
-    ) -> int:
-        """Bulk update active status for multiple users. Returns count updated."""
+    ) -> list[UUID]:
+        """Bulk update active status for multiple users. Returns IDs updated."""
         return await self._repo.bulk_update_status(
             db, user_ids=user_ids, is_active=is_active
         )
@@ -82,39 +113,79 @@ class UserService:
         *,
         user_ids: list[UUID],
         exclude_user_id: UUID | None = None,
-    ) -> int:
-        """Bulk soft-delete multiple users. Returns count deleted."""
+    ) -> list[UUID]:
+        """Bulk soft-delete multiple users. Returns IDs deleted."""
         return await self._repo.bulk_soft_delete(
             db, user_ids=user_ids, exclude_user_id=exclude_user_id
         )
 
+    async def stream_users(
+        self, db: AsyncSession, *, batch_size: int = 500
+    ) -> AsyncIterator[Sequence[User]]:
+        """
+        Yield all non-deleted users, oldest first, in batches of ``batch_size``.
+
+        Rows come from a server-side cursor, so memory stays bounded by one
+        batch however many users there are.
+        """
+        from sqlalchemy import select
+
+        result = await db.stream_scalars(
+            select(User)
+            .where(User.deleted_at.is_(None))
+            .order_by(User.created_at)
+            .execution_options(yield_per=batch_size)
+        )
+        async for batch in result.partitions():
+            yield batch
+
     async def get_stats(self, db: AsyncSession) -> dict[str, Any]:
         """Return user stats needed for the admin dashboard."""
-        from sqlalchemy import func, select
-
-        total_users = (
-            await db.execute(select(func.count()).select_from(User))
-        ).scalar() or 0
-        active_count = (
-            await db.execute(
-                select(func.count()).select_from(User).where(User.is_active)
-            )
-        ).scalar() or 0
-        inactive_count = (
-            await db.execute(
-                select(func.count()).select_from(User).where(User.is_active.is_(False))
-            )
-        ).scalar() or 0
-        all_users = list(
-            (await db.execute(select(User).order_by(User.created_at))).scalars().all()
+        from sqlalchemy import case, func, select
+
+        # One scan for all three counts instead of a query per count
+        result = await db.execute(
+            select(
+                func.count(),
+                func.sum(case((User.is_active, 1), else_=0)),
+                func.sum(case((User.is_active.is_(False), 1), else_=0)),
+            ).select_from(User)
         )
+        total_users, active_count, inactive_count = result.one()
         return {
             "total_users": total_users,
-            "active_count": active_count,
-            "inactive_count": inactive_count,
-            "all_users": all_users,
+            "active_count": active_count or 0,
+            "inactive_count": inactive_count or 0,
         }
 
+    async def get_daily_registrations(
+        self, db: AsyncSession, *, since: datetime
+    ) -> dict[date, tuple[int, int]]:
+        """
+        Count users created on each (UTC) day since ``since``.
+
+        Returns a mapping of day -> (registrations, still-active registrations);
+        days without registrations are left out.
+        """
+        from sqlalchemy import Date, case, func, select
+
+        created_at = User.created_at
+        if db.get_bind().dialect.name == "postgresql":
+            # date() of a timestamptz uses the session TimeZone; shift to UTC
+            # first. SQLite stores the UTC timestamps as text, already in UTC.
+            created_at = func.timezone("UTC", created_at)
+        day = func.date(created_at, type_=Date).label("day")
+        result = await db.execute(
+            select(
+                day,
+                func.count(),
+                func.sum(case((User.is_active, 1), else_=0)),
+            )
+            .where(User.created_at >= since)
+            .group_by(day)
+        )
+        return {row[0]: (row[1], row[2] or 0) for row in result.all()}
+
 
 # Default singleton
 user_service = UserService()
@@ -0,0 +1,75 @@
+"""
+Utility functions for conditional GET (ETag / If-None-Match) on list endpoints.
+"""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+from app.core.config import settings
+
+# Clients must revalidate on every use, and shared caches must not keep
+# responses that were served to an authenticated caller
+CACHE_CONTROL = "private, must-revalidate"
+
+
+def make_list_etag(request: Request, *markers: object) -> str:
+    """
+    Build a weak ETag for a list response.
+
+    The tag covers the request's query parameters (page, filters, sorting),
+    the data markers passed in, and the app version, so a client never
+    revalidates against a response shaped by an older release.
+
+    Args:
+        request: FastAPI Request object
+        *markers: Values that change whenever the listed data changes,
+            e.g. a table's row count and latest updated_at
+
+    Returns:
+        Weak ETag string such as W/"3f2a..."
+    """
+    query = sorted(request.query_params.multi_items())
+    payload = repr((settings.VERSION, request.url.path, query, markers))
+    return f'W/"{hashlib.sha256(payload.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check the request's If-None-Match header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match.
+
+    Args:
+        request: FastAPI Request object
+        etag: ETag of the current representation
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Build the empty 304 response for a matching If-None-Match.
+
+    Args:
+        etag: ETag of the current representation
+
+    Returns:
+        304 Not Modified response carrying the ETag and Cache-Control headers
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
@@ -7,12 +7,17 @@ import pytest_asyncio
 from fastapi import HTTPException
 
 from app.api.dependencies.auth import (
+    _user_cache,
     get_current_active_user,
     get_current_superuser,
     get_current_user,
     get_optional_current_user,
 )
-from app.core.auth import TokenExpiredError, TokenInvalidError, get_password_hash
+from app.core.auth import (
+    TokenExpiredError,
+    TokenInvalidError,
+    get_password_hash,
+)
 from app.models.user import User
 
 
@@ -147,28 +152,11 @@ class TestGetCurrentUser:
 class TestGetCurrentActiveUser:
     """Tests for get_current_active_user dependency"""
 
-    def test_get_current_active_user(self, mock_user):
-        """Test getting an active user"""
-        # Ensure user is active
-        mock_user.is_active = True
-
-        # Call the dependency with mocked current_user
-        user = get_current_active_user(current_user=mock_user)
-
-        # Should return the same user
-        assert user == mock_user
-
-    def test_get_current_inactive_user(self, mock_user):
-        """Test getting an inactive user"""
-        # Make user inactive
-        mock_user.is_active = False
-
-        # Should raise HTTPException with 403 status
-        with pytest.raises(HTTPException) as exc_info:
-            get_current_active_user(current_user=mock_user)
-
-        assert exc_info.value.status_code == 403
-        assert "Inactive user" in exc_info.value.detail
+    def test_get_current_active_user_is_get_current_user(self):
+        """Test that active-user routes share get_current_user's checks"""
+        # Inactive users are rejected by get_current_user (see
+        # test_get_current_user_inactive)
+        assert get_current_active_user is get_current_user
 
 
 class TestGetCurrentSuperuser:
@@ -290,3 +278,125 @@ class TestGetOptionalCurrentUser:
 
                 # Should return None for inactive users
                 assert user is None
+
+
+@pytest.fixture
+def user_cache():
+    """Enable the authenticated user cache, which is off by default"""
+    with patch.object(_user_cache, "ttl", 30):
+        yield _user_cache
+    _user_cache.clear()
+
+
+@pytest.mark.usefixtures("user_cache")
+class TestCurrentUserCache:
+    """Tests for the authenticated user cache"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_skips_database(
+        self, async_test_db, async_mock_user, mock_token
+    ):
+        """Test that a cached user is served without querying the database"""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        with patch("app.api.dependencies.auth.get_token_data") as mock_get_data:
+            mock_get_data.return_value.user_id = async_mock_user.id
+
+            async with AsyncTestingSessionLocal() as session:
+                await get_current_user(db=session, token=mock_token)
+
+            async with AsyncTestingSessionLocal() as session:
+                with patch.object(
+                    session, "get", side_effect=AssertionError("database queried")
+                ):
+                    user = await get_current_user(db=session, token=mock_token)
+
+                    assert user.id == async_mock_user.id
+                    assert user.email == async_mock_user.email
+                    assert user in session
+
+    @pytest.mark.asyncio
+    async def test_password_hash_is_not_cached(
+        self, async_test_db, async_mock_user, mock_token
+    ):
+        """Test that cached users leave the password hash unloaded"""
+        from sqlalchemy import inspect
+
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        with patch("app.api.dependencies.auth.get_token_data") as mock_get_data:
+            mock_get_data.return_value.user_id = async_mock_user.id
+
+            async with AsyncTestingSessionLocal() as session:
+                await get_current_user(db=session, token=mock_token)
+
+            assert "password_hash" not in _user_cache.get(async_mock_user.id)
+
+            async with AsyncTestingSessionLocal() as session:
+                user = await get_current_user(db=session, token=mock_token)
+
+                assert "password_hash" in inspect(user).unloaded
+                await session.refresh(user, attribute_names=["password_hash"])
+                assert user.password_hash == async_mock_user.password_hash
+
+    @pytest.mark.asyncio
+    async def test_user_update_invalidates_cache(
+        self, async_test_db, async_mock_user, mock_token
+    ):
+        """Test that committing a change to a user evicts the cached copy"""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        with patch("app.api.dependencies.auth.get_token_data") as mock_get_data:
+            mock_get_data.return_value.user_id = async_mock_user.id
+
+            async with AsyncTestingSessionLocal() as session:
+                user = await get_current_user(db=session, token=mock_token)
+                user.is_active = False
+                await session.commit()
+
+            async with AsyncTestingSessionLocal() as session:
+                with pytest.raises(HTTPException) as exc_info:
+                    await get_current_user(db=session, token=mock_token)
+
+                assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_invalidates_cache(
+        self, async_test_db, async_mock_user, mock_token
+    ):
+        """Test that an UPDATE statement against users clears the cache"""
+        from sqlalchemy import update
+
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        with patch("app.api.dependencies.auth.get_token_data") as mock_get_data:
+            mock_get_data.return_value.user_id = async_mock_user.id
+
+            async with AsyncTestingSessionLocal() as session:
+                await get_current_user(db=session, token=mock_token)
+                await session.execute(
+                    update(User)
+                    .where(User.id == async_mock_user.id)
+                    .values(first_name="Renamed")
+                )
+                await session.commit()
+
+            async with AsyncTestingSessionLocal() as session:
+                user = await get_current_user(db=session, token=mock_token)
+
+                assert user.first_name == "Renamed"
+
+
+class TestCurrentUserCacheDisabled:
+    """Tests for the default, disabled user cache"""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(
+        self, async_test_db, async_mock_user, mock_token
+    ):
+        """Test that every lookup reads the database unless the cache is enabled"""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        with patch("app.api.dependencies.auth.get_token_data") as mock_get_data:
+            mock_get_data.return_value.user_id = async_mock_user.id
+
+            async with AsyncTestingSessionLocal() as session:
+                await get_current_user(db=session, token=mock_token)
+
+        assert not _user_cache.enabled
+        assert len(_user_cache) == 0
@@ -87,6 +87,21 @@ class TestParseAcceptLanguage:
         result = parse_accept_language("it-CH,en;q=0.8")
         assert result == "it"
 
+    def test_parse_malformed_subtags_fall_back_to_language_code(self):
+        """Test that empty or over-long subtags still match the language code"""
+        assert parse_accept_language("en-") == "en"
+        assert parse_accept_language("it-;q=0.9") == "it"
+        assert parse_accept_language("fr,it-verylongsubtag") == "it"
+
+    def test_parse_is_memoized(self):
+        """Test that repeated headers are served from the cache"""
+        header = "en-GB,en;q=0.9,it;q=0.8"
+        parse_accept_language(header)
+        hits = parse_accept_language.cache_info().hits
+
+        assert parse_accept_language(header) == "en-gb"
+        assert parse_accept_language.cache_info().hits == hits + 1
+
 
 @pytest_asyncio.fixture
 async def async_user_with_locale_en(async_test_db):
@@ -91,6 +91,187 @@ class TestAdminListUsers:
         data = response.json()
         assert "data" in data
 
+    @pytest.mark.asyncio
+    async def test_admin_list_users_without_total(
+        self, client, async_test_user, async_test_superuser, superuser_token
+    ):
+        """Test include_total=false skips the count and reports has_next."""
+        headers = {"Authorization": f"Bearer {superuser_token}"}
+
+        response = await client.get(
+            "/api/v1/admin/users?include_total=false&limit=1", headers=headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["data"]) == 1
+        assert data["pagination"]["total"] is None
+        assert data["pagination"]["total_pages"] is None
+        assert data["pagination"]["has_next"] is True
+
+        response = await client.get(
+            "/api/v1/admin/users?include_total=false&limit=1&page=2", headers=headers
+        )
+
+        data = response.json()
+        assert len(data["data"]) == 1
+        assert data["pagination"]["has_next"] is False
+        assert data["pagination"]["has_prev"] is True
+
+    @pytest.mark.asyncio
+    async def test_admin_list_users_cursor(
+        self, client, async_test_superuser, async_test_db, superuser_token
+    ):
+        """Test following next_cursor walks every user exactly once."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        headers = {"Authorization": f"Bearer {superuser_token}"}
+
+        async with AsyncTestingSessionLocal() as session:
+            from app.models.user import User
+
+            for i in range(4):
+                session.add(
+                    User(
+                        email=f"cursor{i}@example.com",
+                        password_hash="hash",
+                        first_name="Cursor",
+                    )
+                )
+            await session.commit()
+
+        response = await client.get("/api/v1/admin/users?limit=2", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        seen = [u["email"] for u in data["data"]]
+        cursor = data["pagination"]["next_cursor"]
+
+        while cursor:
+            response = await client.get(
+                f"/api/v1/admin/users?limit=2&cursor={cursor}", headers=headers
+            )
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert data["pagination"]["total"] is None
+            seen += [u["email"] for u in data["data"]]
+            cursor = data["pagination"]["next_cursor"]
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    @pytest.mark.asyncio
+    async def test_admin_list_users_cursor_invalid(self, client, superuser_token):
+        """Test a malformed cursor or a non-created_at sort is rejected."""
+        headers = {"Authorization": f"Bearer {superuser_token}"}
+
+        response = await client.get(
+            "/api/v1/admin/users?cursor=not-a-cursor", headers=headers
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        response = await client.get("/api/v1/admin/users?limit=1", headers=headers)
+        cursor = response.json()["pagination"]["next_cursor"]
+        response = await client.get(
+            f"/api/v1/admin/users?sort_by=email&cursor={cursor}", headers=headers
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_admin_list_users_total_excludes_soft_deleted(
+        self, client, async_test_superuser, async_test_db, superuser_token
+    ):
+        """Test the total counts only listed users, never the whole table."""
+        from unittest.mock import patch
+
+        from app.models.user import User
+        from app.repositories.user import user_repo
+
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        async with AsyncTestingSessionLocal() as session:
+            for i in range(3):
+                session.add(
+                    User(
+                        email=f"gone{i}@example.com",
+                        password_hash="x",
+                        deleted_at=datetime.now(UTC),
+                    )
+                )
+            await session.commit()
+
+        # The table-wide planner estimate would include soft-deleted rows
+        with patch.object(user_repo, "estimate_count") as mock_estimate:
+            response = await client.get(
+                "/api/v1/admin/users",
+                headers={"Authorization": f"Bearer {superuser_token}"},
+            )
+        mock_estimate.assert_not_called()
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [user["email"] for user in data["data"]] == [async_test_superuser.email]
+        assert data["pagination"]["total"] == 1
+        assert data["pagination"]["is_estimate"] is False
+
+    @pytest.mark.asyncio
+    async def test_admin_list_users_etag(
+        self, client, async_test_superuser, async_test_db, superuser_token
+    ):
+        """Test If-None-Match gets 304 until a user changes."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        headers = {"Authorization": f"Bearer {superuser_token}"}
+
+        response = await client.get("/api/v1/admin/users", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, must-revalidate"
+
+        response = await client.get(
+            "/api/v1/admin/users", headers={**headers, "If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+        async with AsyncTestingSessionLocal() as session:
+            from app.core.auth import get_password_hash
+            from app.models.user import User
+
+            session.add(
+                User(
+                    email="etag@example.com",
+                    password_hash=get_password_hash("TestPassword123!"),
+                    first_name="Etag",
+                )
+            )
+            await session.commit()
+
+        response = await client.get(
+            "/api/v1/admin/users", headers={**headers, "If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_admin_list_users_no_etag_without_count(
+        self, client, async_test_user, async_test_superuser, superuser_token
+    ):
+        """Test uncounted and cursor pages skip the ETag and its change marker."""
+        headers = {"Authorization": f"Bearer {superuser_token}"}
+
+        response = await client.get(
+            "/api/v1/admin/users?include_total=false&limit=1", headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert "etag" not in response.headers
+
+        response = await client.get("/api/v1/admin/users?limit=1", headers=headers)
+        etag = response.headers["etag"]
+        cursor = response.json()["pagination"]["next_cursor"]
+        response = await client.get(
+            f"/api/v1/admin/users?limit=1&cursor={cursor}",
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert "etag" not in response.headers
+
     @pytest.mark.asyncio
     async def test_admin_list_users_unauthorized(self, client, async_test_user):
         """Test non-admin cannot list users."""
@@ -108,6 +289,59 @@ class TestAdminListUsers:
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+class TestAdminExportUsers:
+    """Tests for GET /admin/users/export endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_export_users_ndjson(
+        self,
+        client,
+        async_test_superuser,
+        async_test_user,
+        async_test_db,
+        superuser_token,
+    ):
+        """Test users stream as NDJSON, oldest first, without soft-deleted users."""
+        import json
+
+        from app.models.user import User
+
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        async with AsyncTestingSessionLocal() as session:
+            session.add(
+                User(
+                    email="gone@example.com",
+                    password_hash="x",
+                    deleted_at=datetime.now(UTC),
+                )
+            )
+            await session.commit()
+
+        response = await client.get(
+            "/api/v1/admin/users/export",
+            headers={"Authorization": f"Bearer {superuser_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["email"] for row in rows] == [
+            async_test_superuser.email,
+            async_test_user.email,
+        ]
+        assert "password_hash" not in rows[0]
+
+    @pytest.mark.asyncio
+    async def test_export_users_unauthorized(self, client, async_test_user, user_token):
+        """Test that non-admin users cannot export users."""
+        response = await client.get(
+            "/api/v1/admin/users/export",
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
 class TestAdminCreateUser:
     """Tests for POST /admin/users endpoint."""
 
@@ -472,6 +706,34 @@ class TestAdminBulkUserAction:
         data = response.json()
         assert data["affected_count"] >= 0
 
+    @pytest.mark.asyncio
+    async def test_admin_bulk_action_reports_failed_ids(
+        self, client, async_test_superuser, async_test_user, superuser_token
+    ):
+        """Test IDs the action did not change are returned as failed_ids."""
+        missing_id = str(uuid4())
+
+        response = await client.post(
+            "/api/v1/admin/users/bulk-action",
+            json={
+                "action": "delete",
+                "user_ids": [
+                    str(async_test_user.id),
+                    str(async_test_superuser.id),
+                    missing_id,
+                ],
+            },
+            headers={"Authorization": f"Bearer {superuser_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["success"] is True
+        assert data["affected_count"] == 1
+        assert data["failed_count"] == 2
+        # The acting admin is never deleted; the unknown ID matches no row
+        assert data["failed_ids"] == [str(async_test_superuser.id), missing_id]
+
 
 # ===== ORGANIZATION MANAGEMENT TESTS =====
 
@@ -502,6 +764,94 @@ class TestAdminListOrganizations:
         assert "data" in data
         assert "pagination" in data
 
+    @pytest.mark.asyncio
+    async def test_admin_list_organizations_without_total(
+        self, client, async_test_superuser, async_test_db, superuser_token
+    ):
+        """Test include_total=false skips the count and reports has_next."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+
+        async with AsyncTestingSessionLocal() as session:
+            session.add(Organization(name="First Org", slug="first-org"))
+            session.add(Organization(name="Second Org", slug="second-org"))
+            await session.commit()
+
+        response = await client.get(
+            "/api/v1/admin/organizations?include_total=false&limit=1",
+            headers={"Authorization": f"Bearer {superuser_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["data"]) == 1
+        assert data["pagination"]["total"] is None
+        assert data["pagination"]["has_next"] is True
+        assert "etag" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_admin_list_organizations_estimated_total(
+        self, client, superuser_token
+    ):
+        """Test an unfiltered list on a large table reports the estimated total."""
+        from unittest.mock import AsyncMock, patch
+
+        from app.api.routes.admin import organization_service
+
+        headers = {"Authorization": f"Bearer {superuser_token}"}
+
+        with patch.object(
+            organization_service, "estimate_count", AsyncMock(return_value=250_000)
+        ):
+            response = await client.get("/api/v1/admin/organizations", headers=headers)
+            assert response.status_code == status.HTTP_200_OK
+            pagination = response.json()["pagination"]
+            assert pagination["total"] == 250_000
+            assert pagination["is_estimate"] is True
+            assert pagination["has_next"] is False
+            assert "etag" not in response.headers
+
+            # Filtered lists keep the exact count
+            response = await client.get(
+                "/api/v1/admin/organizations?is_active=true", headers=headers
+            )
+            pagination = response.json()["pagination"]
+            assert pagination["total"] == 0
+            assert pagination["is_estimate"] is False
+            assert "etag" in response.headers
+
+    @pytest.mark.asyncio
+    async def test_admin_list_organizations_cursor(
+        self, client, async_test_superuser, async_test_db, superuser_token
+    ):
+        """Test following next_cursor walks every organization exactly once."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        headers = {"Authorization": f"Bearer {superuser_token}"}
+
+        async with AsyncTestingSessionLocal() as session:
+            for i in range(3):
+                session.add(
+                    Organization(name=f"Cursor Org {i}", slug=f"cursor-org-{i}")
+                )
+            await session.commit()
+
+        response = await client.get(
+            "/api/v1/admin/organizations?limit=2", headers=headers
+        )
+        data = response.json()
+        seen = [o["slug"] for o in data["data"]]
+        cursor = data["pagination"]["next_cursor"]
+        assert cursor
+
+        response = await client.get(
+            f"/api/v1/admin/organizations?limit=2&cursor={cursor}", headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        seen += [o["slug"] for o in data["data"]]
+
+        assert data["pagination"]["next_cursor"] is None
+        assert sorted(seen) == ["cursor-org-0", "cursor-org-1", "cursor-org-2"]
+
     @pytest.mark.asyncio
     async def test_admin_list_organizations_with_search(
         self, client, async_test_superuser, async_test_db, superuser_token
@@ -1206,6 +1556,94 @@ class TestAdminStats:
         status_names = {item["name"] for item in data["user_status"]}
         assert status_names == {"Active", "Inactive"}
 
+    @pytest.mark.asyncio
+    async def test_admin_get_stats_daily_series(
+        self,
+        client,
+        async_test_superuser,
+        async_test_user,
+        async_test_db,
+        superuser_token,
+    ):
+        """Test growth and registration series are bucketed by creation day."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        now = datetime.now(UTC)
+
+        async with AsyncTestingSessionLocal() as session:
+            from app.models.user import User
+
+            for email, days_ago, is_active in [
+                ("old@example.com", 40, True),
+                ("recent@example.com", 10, False),
+            ]:
+                session.add(
+                    User(
+                        email=email,
+                        password_hash="x",
+                        first_name="Series",
+                        is_active=is_active,
+                        created_at=now - timedelta(days=days_ago),
+                    )
+                )
+            await session.commit()
+
+        response = await client.get(
+            "/api/v1/admin/stats",
+            headers={"Authorization": f"Bearer {superuser_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        growth = data["user_growth"]
+
+        # 29 days ago only the 40-day-old user existed
+        assert growth[0]["total_users"] == 1
+        assert growth[0]["active_users"] == 1
+        # 10 days ago the inactive user joined
+        assert growth[19]["total_users"] == 2
+        assert growth[19]["active_users"] == 1
+        # Today both fixture users are counted
+        assert growth[-1]["total_users"] == 4
+        assert growth[-1]["active_users"] == 3
+        assert growth[-1]["date"] == now.strftime("%b %d")
+
+        registrations = [d["registrations"] for d in data["registration_activity"]]
+        assert registrations == [0, 0, 0, 1] + [0] * 9 + [2]
+
+    @pytest.mark.asyncio
+    async def test_admin_get_stats_cached_until_users_change(
+        self, client, async_test_superuser, async_test_db, superuser_token
+    ):
+        """Test stats are served from cache and refreshed after user writes."""
+        from unittest.mock import patch
+
+        from app.api.routes.admin import user_service
+
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        headers = {"Authorization": f"Bearer {superuser_token}"}
+
+        with patch.object(
+            user_service, "get_stats", wraps=user_service.get_stats
+        ) as mock_get_stats:
+            first = await client.get("/api/v1/admin/stats", headers=headers)
+            second = await client.get("/api/v1/admin/stats", headers=headers)
+            assert mock_get_stats.await_count == 1
+            assert second.json() == first.json()
+
+            async with AsyncTestingSessionLocal() as session:
+                from app.models.user import User
+
+                session.add(User(email="newstats@example.com", password_hash="x"))
+                await session.commit()
+
+            third = await client.get("/api/v1/admin/stats", headers=headers)
+            assert mock_get_stats.await_count == 2
+
+        assert (
+            third.json()["user_growth"][-1]["total_users"]
+            == first.json()["user_growth"][-1]["total_users"] + 1
+        )
+
     @pytest.mark.asyncio
     async def test_admin_get_stats_unauthorized(
         self, client, async_test_user, user_token
@@ -1217,3 +1655,49 @@ class TestAdminStats:
         )
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestAdminPoolStats:
+    """Tests for GET /admin/pool-stats endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_admin_get_pool_stats(self, client, superuser_token):
+        """Test pool stats report the configured size and current usage."""
+        from app.core.config import settings
+
+        response = await client.get(
+            "/api/v1/admin/pool-stats",
+            headers={"Authorization": f"Bearer {superuser_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["size"] == settings.db_pool_size
+        assert data["max_overflow"] == settings.db_max_overflow
+        assert data["overflow"] >= 0
+        assert data["checked_out"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_admin_get_pool_stats_unsupported_pool(self, client, superuser_token):
+        """Test a pool that does not report usage gives 404."""
+        from unittest.mock import patch
+
+        with patch("app.api.routes.admin.get_pool_stats", return_value=None):
+            response = await client.get(
+                "/api/v1/admin/pool-stats",
+                headers={"Authorization": f"Bearer {superuser_token}"},
+            )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_admin_get_pool_stats_unauthorized(
+        self, client, async_test_user, user_token
+    ):
+        """Test that non-admin users cannot access pool stats."""
+        response = await client.get(
+            "/api/v1/admin/pool-stats",
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
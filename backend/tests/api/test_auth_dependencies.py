@@ -147,28 +147,11 @@ class TestGetCurrentUser:
 class TestGetCurrentActiveUser:
     """Tests for get_current_active_user dependency"""
 
-    def test_get_current_active_user(self, mock_user):
-        """Test getting an active user"""
-        # Ensure user is active
-        mock_user.is_active = True
-
-        # Call the dependency with mocked current_user
-        user = get_current_active_user(current_user=mock_user)
-
-        # Should return the same user
-        assert user == mock_user
-
-    def test_get_current_inactive_user(self, mock_user):
-        """Test getting an inactive user"""
-        # Make user inactive
-        mock_user.is_active = False
-
-        # Should raise HTTPException with 403 status
-        with pytest.raises(HTTPException) as exc_info:
-            get_current_active_user(current_user=mock_user)
-
-        assert exc_info.value.status_code == 403
-        assert "Inactive user" in exc_info.value.detail
+    def test_get_current_active_user_is_get_current_user(self):
+        """Test that active-user routes share get_current_user's checks"""
+        # Inactive users are rejected by get_current_user (see
+        # test_get_current_user_inactive)
+        assert get_current_active_user is get_current_user
 
 
 class TestGetCurrentSuperuser:
@@ -421,6 +421,8 @@ class TestUpdateOrganization:
         data = response.json()
         assert data["name"] == "Updated Admin Org"
         assert data["description"] == "Updated description"
+        # The admin is the only member
+        assert data["member_count"] == 1
 
     @pytest.mark.asyncio
     async def test_update_organization_as_owner_success(
@@ -554,7 +556,7 @@ class TestOrganizationExceptionHandlers:
     ):
         """Test generic exception handler in get_organization (covers lines 124-128)."""
         with patch(
-            "app.api.routes.organizations.organization_service.get_organization",
+            "app.api.routes.organizations.organization_service.get_org_with_member_count",
             side_effect=Exception("Database timeout"),
         ):
             with pytest.raises(Exception, match="Database timeout"):
@@ -591,7 +593,7 @@ class TestOrganizationExceptionHandlers:
         admin_token = login_response.json()["access_token"]
 
         with patch(
-            "app.api.routes.organizations.organization_service.get_organization",
+            "app.api.routes.organizations.organization_service.get_org_with_member_count",
             return_value=test_org_with_user_admin,
         ):
             with patch(
@@ -244,6 +244,24 @@ class TestPermissionEdgeCases:
         # This prevents leaking information about org existence
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    @pytest.mark.asyncio
+    async def test_insufficient_role_detail(self, async_test_user):
+        """Test the 403 detail names the user's role and the required roles."""
+        from fastapi import HTTPException
+
+        from app.api.dependencies.permissions import require_org_admin
+
+        with pytest.raises(HTTPException) as exc_info:
+            await require_org_admin(
+                current_user=async_test_user, user_role=OrganizationRole.MEMBER
+            )
+
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+        assert exc_info.value.detail == (
+            "Role OrganizationRole.MEMBER not authorized. Required: "
+            "[<OrganizationRole.OWNER: 'owner'>, <OrganizationRole.ADMIN: 'admin'>]"
+        )
+
 
 # ===== Admin Role Tests =====
 
@@ -286,3 +304,101 @@ class TestAdminRolePermissions:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["name"] == "Updated by Admin"
+
+
+class TestRoleLookupSharing:
+    """Test stacked organization checks share one role lookup per request."""
+
+    @pytest.mark.asyncio
+    async def test_stacked_permission_checks_query_role_once(
+        self, async_test_user, test_org_with_member
+    ):
+        """Stacking membership and role checks should query the role once."""
+        from unittest.mock import AsyncMock, patch
+
+        from fastapi import Depends, FastAPI
+        from httpx import ASGITransport, AsyncClient
+
+        from app.api.dependencies.auth import get_current_user
+        from app.api.dependencies.permissions import (
+            require_org_member,
+            require_org_membership,
+        )
+        from app.core.database import get_db
+
+        app = FastAPI()
+
+        @app.get("/orgs/{organization_id}")
+        async def stacked(
+            _member: User = Depends(require_org_membership),
+            _role: User = Depends(require_org_member),
+        ):
+            return {"ok": True}
+
+        app.dependency_overrides[get_current_user] = lambda: async_test_user
+        app.dependency_overrides[get_db] = lambda: None
+
+        with patch(
+            "app.api.dependencies.permissions.organization_service.get_user_role_in_org",
+            new=AsyncMock(return_value=OrganizationRole.MEMBER),
+        ) as mock_get_role:
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.get(f"/orgs/{test_org_with_member.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_get_role.assert_awaited_once()
+
+
+class TestRoleCache:
+    """Test the per-worker role cache and its invalidation on writes."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookups_served_from_cache(self, async_test_user):
+        """A second lookup for the same user and org should skip the query."""
+        from unittest.mock import AsyncMock, patch
+
+        from app.api.dependencies.permissions import _get_user_role
+
+        organization_id = uuid4()
+
+        with patch(
+            "app.api.dependencies.permissions.organization_service.get_user_role_in_org",
+            new=AsyncMock(return_value=None),
+        ) as mock_get_role:
+            for _ in range(2):
+                role = await _get_user_role(
+                    organization_id, current_user=async_test_user, db=None
+                )
+                assert role is None
+
+        mock_get_role.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_membership_writes_invalidate_cache(
+        self, async_test_db, async_test_user, test_org_with_member
+    ):
+        """Role changes and removals should be visible on the next lookup."""
+        from app.api.dependencies.permissions import _get_user_role
+
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        async with AsyncTestingSessionLocal() as session:
+
+            async def lookup():
+                return await _get_user_role(
+                    test_org_with_member.id, current_user=async_test_user, db=session
+                )
+
+            assert await lookup() == OrganizationRole.MEMBER
+
+            membership = await session.get(
+                UserOrganization, (async_test_user.id, test_org_with_member.id)
+            )
+            membership.role = OrganizationRole.ADMIN
+            await session.commit()
+            assert await lookup() == OrganizationRole.ADMIN
+
+            await session.delete(membership)
+            await session.commit()
+            assert await lookup() is None
@@ -1,6 +1,8 @@
 # tests/core/test_auth.py
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import jwt
 import pytest
@@ -233,3 +235,38 @@ class TestTokenDecoding:
 
         assert token_data.user_id == user_id
         assert token_data.is_superuser is True
+
+    def test_get_token_data_verifies_repeat_token_once(self):
+        """Test that a verified token is answered from the cache"""
+        user_id = uuid.uuid4()
+        token = create_access_token(subject=str(user_id))
+
+        with patch("app.core.auth.decode_token", wraps=decode_token) as mock_decode:
+            first = get_token_data(token)
+            second = get_token_data(token)
+
+        assert first.user_id == second.user_id == user_id
+        assert mock_decode.call_count == 1
+
+    def test_get_token_data_cache_expires_with_token(self):
+        """Test that a cached token is verified again once its lifetime has passed"""
+        token = create_access_token(
+            subject=str(uuid.uuid4()), expires_delta=timedelta(seconds=30)
+        )
+        get_token_data(token)
+
+        with (
+            patch("app.core.cache.time.monotonic", return_value=time.monotonic() + 31),
+            patch(
+                "app.core.auth.decode_token",
+                side_effect=TokenExpiredError("Token has expired"),
+            ),
+        ):
+            with pytest.raises(TokenExpiredError):
+                get_token_data(token)
+
+    def test_get_token_data_does_not_cache_failures(self):
+        """Test that verification failures are raised on every call"""
+        for _ in range(2):
+            with pytest.raises(TokenInvalidError):
+                get_token_data("not.a.token")
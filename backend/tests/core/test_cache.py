@@ -0,0 +1,104 @@
+# tests/core/test_cache.py
+from unittest.mock import patch
+
+from app.core.cache import ALL_KEYS, InvalidatingTTLCache, TTLCache
+
+
+class TestTTLCache:
+    """Tests for the in-process TTL cache"""
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned until it expires"""
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("missing", "default") == "default"
+
+    def test_expired_entry_is_dropped(self):
+        """Test that entries expire ttl seconds after insertion"""
+        cache = TTLCache(maxsize=10, ttl=30)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value")
+        with patch("app.core.cache.time.monotonic", return_value=130.0):
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_entry_ttl_shortens_lifetime(self):
+        """Test that a per-entry ttl expires the entry early, never late"""
+        cache = TTLCache(maxsize=10, ttl=30)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("short", 1, ttl=5)
+            cache.set("long", 2, ttl=60)
+            cache.set("expired", 3, ttl=-1)
+        with patch("app.core.cache.time.monotonic", return_value=110.0):
+            assert cache.get("short") is None
+            assert cache.get("long") == 2
+            assert cache.get("expired") is None
+        with patch("app.core.cache.time.monotonic", return_value=130.0):
+            assert cache.get("long") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache never grows past maxsize"""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a ttl of 0 stores nothing"""
+        cache = TTLCache(maxsize=10, ttl=0)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+
+    def test_pop_and_clear(self):
+        """Test explicit invalidation"""
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestInvalidatingTTLCache:
+    """Tests for the write-invalidated TTL cache"""
+
+    def test_evict_one_key_or_all(self):
+        """Test that evict drops a single key, or everything for ALL_KEYS"""
+        cache = InvalidatingTTLCache(maxsize=10, ttl=30, stale_keys=lambda s: ())
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.evict("a")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.evict(ALL_KEYS)
+        assert len(cache) == 0
+
+    def test_disabled_cache_ignores_flushes(self):
+        """Test that a disabled cache never asks which keys went stale"""
+        from unittest.mock import MagicMock
+
+        from app.core.cache import _evict_flushed
+
+        stale_keys = MagicMock(return_value=())
+        cache = InvalidatingTTLCache(maxsize=10, ttl=0, stale_keys=stale_keys)
+
+        _evict_flushed(MagicMock(info={}), None)
+
+        assert not cache.enabled
+        stale_keys.assert_not_called()
@@ -647,6 +647,28 @@ class TestRepositoryBaseCount:
                     await user_repo.count(session)
 
 
+class TestRepositoryBaseEstimateCount:
+    """Tests for estimate_count method."""
+
+    @pytest.mark.asyncio
+    async def test_estimate_count_not_postgresql(self, async_test_db, async_test_user):
+        """Test the estimate is unavailable outside PostgreSQL."""
+        _test_engine, SessionLocal = async_test_db
+
+        async with SessionLocal() as session:
+            assert await user_repo.estimate_count(session, min_rows=1) is None
+
+    @pytest.mark.asyncio
+    async def test_estimate_count_disabled(self, async_test_db):
+        """Test a non-positive threshold disables the estimate."""
+        _test_engine, SessionLocal = async_test_db
+
+        async with SessionLocal() as session:
+            with patch.object(session, "execute") as mock_execute:
+                assert await user_repo.estimate_count(session, min_rows=0) is None
+                mock_execute.assert_not_called()
+
+
 class TestRepositoryBaseExists:
     """Tests for exists method."""
 
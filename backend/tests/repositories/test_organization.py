@@ -248,6 +248,48 @@ class TestGetMemberCount:
             assert count == 0
 
 
+class TestGetWithMemberCount:
+    """Tests for get_with_member_count method."""
+
+    @pytest.mark.asyncio
+    async def test_get_with_member_count(self, async_test_db, async_test_user):
+        """Test the organization comes back with its active member count."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+
+        async with AsyncTestingSessionLocal() as session:
+            org = Organization(name="Counted Org", slug="counted-org")
+            session.add(org)
+            await session.commit()
+
+            user_org = UserOrganization(
+                user_id=async_test_user.id,
+                organization_id=org.id,
+                role=OrganizationRole.MEMBER,
+                is_active=True,
+            )
+            session.add(user_org)
+            await session.commit()
+            org_id = org.id
+
+        async with AsyncTestingSessionLocal() as session:
+            found = await organization_repo.get_with_member_count(
+                session, organization_id=org_id
+            )
+            assert found.id == org_id
+            assert found.member_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_with_member_count_not_found(self, async_test_db):
+        """Test a missing organization returns None."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+
+        async with AsyncTestingSessionLocal() as session:
+            result = await organization_repo.get_with_member_count(
+                session, organization_id=uuid4()
+            )
+            assert result is None
+
+
 class TestAddUser:
     """Tests for add_user method."""
 
@@ -690,6 +732,63 @@ class TestIsUserOrgOwner:
             assert is_owner is False
 
 
+class TestGetNameAndUserEmail:
+    """Tests for get_name_and_user_email method."""
+
+    @pytest.mark.asyncio
+    async def test_both_found_or_missing(self, async_test_db, async_test_user):
+        """Test both values come back together, with None for a missing row."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+
+        async with AsyncTestingSessionLocal() as session:
+            org = Organization(name="Named Org", slug="named-org")
+            session.add(org)
+            await session.commit()
+
+            assert await organization_repo.get_name_and_user_email(
+                session, organization_id=org.id, user_id=async_test_user.id
+            ) == ("Named Org", async_test_user.email)
+            assert await organization_repo.get_name_and_user_email(
+                session, organization_id=uuid4(), user_id=async_test_user.id
+            ) == (None, async_test_user.email)
+            assert await organization_repo.get_name_and_user_email(
+                session, organization_id=org.id, user_id=uuid4()
+            ) == ("Named Org", None)
+
+
+class TestGetChangeMarker:
+    """Tests for get_change_marker method."""
+
+    @pytest.mark.asyncio
+    async def test_marker_moves_on_membership_change(
+        self, async_test_db, async_test_user
+    ):
+        """Test adding a member changes the marker even though the org did not."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+
+        async with AsyncTestingSessionLocal() as session:
+            org = Organization(name="Marked Org", slug="marked-org")
+            session.add(org)
+            await session.commit()
+            before = await organization_repo.get_change_marker(session)
+            assert before[0] == 1
+            assert before[2] == 0
+
+            session.add(
+                UserOrganization(
+                    user_id=async_test_user.id,
+                    organization_id=org.id,
+                    role=OrganizationRole.MEMBER,
+                )
+            )
+            await session.commit()
+            after = await organization_repo.get_change_marker(session)
+
+        assert after[:2] == before[:2]
+        assert after[2] == 1
+        assert after != before
+
+
 class TestGetMultiWithMemberCounts:
     """Tests for get_multi_with_member_counts method."""
 
@@ -717,16 +816,13 @@ class TestGetMultiWithMemberCounts:
             await session.commit()
 
         async with AsyncTestingSessionLocal() as session:
-            (
-                orgs_with_counts,
-                total,
-            ) = await organization_repo.get_multi_with_member_counts(session)
+            orgs, total = await organization_repo.get_multi_with_member_counts(session)
 
             assert total == 2
-            assert len(orgs_with_counts) == 2
-            # Verify structure
-            assert "organization" in orgs_with_counts[0]
-            assert "member_count" in orgs_with_counts[0]
+            assert len(orgs) == 2
+            # member_count is loaded onto each organization
+            counts = {org.name: org.member_count for org in orgs}
+            assert counts == {"Org 1": 1, "Org 2": 0}
 
     @pytest.mark.asyncio
     async def test_get_multi_with_member_counts_with_filters(self, async_test_db):
@@ -750,7 +846,7 @@ class TestGetMultiWithMemberCounts:
             )
 
             assert total == 1
-            assert orgs_with_counts[0]["organization"].name == "Active Org"
+            assert orgs_with_counts[0].name == "Active Org"
 
     @pytest.mark.asyncio
     async def test_get_multi_with_member_counts_with_search(self, async_test_db):
@@ -772,7 +868,7 @@ class TestGetMultiWithMemberCounts:
             )
 
             assert total == 1
-            assert orgs_with_counts[0]["organization"].name == "Tech Corp"
+            assert orgs_with_counts[0].name == "Tech Corp"
 
 
 class TestGetUserOrganizationsWithDetails:
@@ -7,8 +7,11 @@ from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
 
 from app.core.repository_exceptions import InvalidInputError
+from app.models.user import User
 from app.models.user_session import UserSession
 from app.repositories.session import session_repo as session_repo
 from app.schemas.sessions import SessionCreate
@@ -569,3 +572,116 @@ class TestGetUserSessionsWithUser:
                 session, user_id=str(async_test_user.id), with_user=True
             )
             assert len(results) >= 1
+
+
+class TestGetAllSessionsWithUser:
+    """Tests for get_all_sessions_with_user projection."""
+
+    @pytest.mark.asyncio
+    async def test_rows_carry_owner_email_and_full_name(
+        self, async_test_db, async_test_user
+    ):
+        """Test rows include the owner's email and name joined in SQL."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+
+        async with AsyncTestingSessionLocal() as session:
+            first_only = User(
+                email="firstonly@example.com",
+                password_hash="hash",
+                first_name="Solo",
+                last_name=None,
+            )
+            session.add(first_only)
+            await session.flush()
+            now = datetime.now(UTC)
+            for user_id, jti, last_used_at in (
+                (async_test_user.id, "projected_1", now),
+                (first_only.id, "projected_2", now - timedelta(minutes=1)),
+            ):
+                session.add(
+                    UserSession(
+                        user_id=user_id,
+                        refresh_token_jti=jti,
+                        device_name="Test Device",
+                        ip_address="192.168.1.1",
+                        is_active=True,
+                        expires_at=now + timedelta(days=7),
+                        last_used_at=last_used_at,
+                    )
+                )
+            await session.commit()
+
+        async with AsyncTestingSessionLocal() as session:
+            rows, total = await session_repo.get_all_sessions_with_user(
+                session, skip=0, limit=10
+            )
+
+        assert total == 2
+        assert [row.user_email for row in rows] == [
+            "testuser@example.com",
+            "firstonly@example.com",
+        ]
+        assert [row.user_full_name for row in rows] == ["Test User", "Solo"]
+        assert rows[0].device_name == "Test Device"
+
+
+class TestGetAllSessions:
+    """Tests for get_all_sessions loading strategy."""
+
+    async def _add_sessions(self, session_factory, user_id, count):
+        now = datetime.now(UTC)
+        async with session_factory() as session:
+            session.add_all(
+                UserSession(
+                    user_id=user_id,
+                    refresh_token_jti=f"all_sessions_{i}",
+                    device_name="Test Device",
+                    ip_address="192.168.1.1",
+                    is_active=True,
+                    expires_at=now + timedelta(days=7),
+                    last_used_at=now,
+                )
+                for i in range(count)
+            )
+            await session.commit()
+
+    @pytest.mark.asyncio
+    async def test_with_user_runs_constant_queries(
+        self, async_test_db, async_test_user
+    ):
+        """Test listing 100 sessions with users takes the count plus one SELECT."""
+        test_engine, AsyncTestingSessionLocal = async_test_db
+        await self._add_sessions(AsyncTestingSessionLocal, async_test_user.id, 100)
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", count_statement)
+        try:
+            async with AsyncTestingSessionLocal() as session:
+                sessions, total = await session_repo.get_all_sessions(
+                    session, limit=100, with_user=True
+                )
+                emails = {s.user.email for s in sessions}
+        finally:
+            event.remove(
+                test_engine.sync_engine, "before_cursor_execute", count_statement
+            )
+
+        assert total == 100
+        assert emails == {async_test_user.email}
+        assert len(statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_unloaded_relationship_raises(self, async_test_db, async_test_user):
+        """Test touching a relationship that was not eager-loaded raises."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        await self._add_sessions(AsyncTestingSessionLocal, async_test_user.id, 1)
+
+        async with AsyncTestingSessionLocal() as session:
+            sessions, _ = await session_repo.get_all_sessions(session, with_user=False)
+
+            with pytest.raises(InvalidRequestError):
+                _ = sessions[0].user
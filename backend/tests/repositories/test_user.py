@@ -293,6 +293,32 @@ class TestGetMultiWithTotal:
             assert total >= 1
             assert any(u.first_name == "Searchable" for u in users)
 
+    @pytest.mark.asyncio
+    async def test_get_multi_with_total_search_within_one_field(self, async_test_db):
+        """Test a term spanning the email and first name doesn't match."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+
+        async with AsyncTestingSessionLocal() as session:
+            user_data = UserCreate(
+                email="boundary@example.com",
+                password="SecurePass123!",
+                first_name="Zephyr",
+                last_name="Crossfield",
+            )
+            await user_repo.create(session, obj_in=user_data)
+
+        async with AsyncTestingSessionLocal() as session:
+            _users, total = await user_repo.get_multi_with_total(
+                session, skip=0, limit=100, search="com zeph"
+            )
+            assert total == 0
+
+            users, total = await user_repo.get_multi_with_total(
+                session, skip=0, limit=100, search="zeph"
+            )
+            assert total == 1
+            assert users[0].email == "boundary@example.com"
+
     @pytest.mark.asyncio
     async def test_get_multi_with_total_pagination(self, async_test_db):
         """Test pagination with skip and limit."""
@@ -382,10 +408,10 @@ class TestBulkUpdateStatus:
 
         # Bulk deactivate
         async with AsyncTestingSessionLocal() as session:
-            count = await user_repo.bulk_update_status(
+            affected_ids = await user_repo.bulk_update_status(
                 session, user_ids=user_ids, is_active=False
             )
-            assert count == 3
+            assert set(affected_ids) == set(user_ids)
 
         # Verify all are inactive
         async with AsyncTestingSessionLocal() as session:
@@ -395,14 +421,14 @@ class TestBulkUpdateStatus:
 
     @pytest.mark.asyncio
     async def test_bulk_update_status_empty_list(self, async_test_db):
-        """Test bulk update with empty list returns 0."""
+        """Test bulk update with empty list returns no IDs."""
         _test_engine, AsyncTestingSessionLocal = async_test_db
 
         async with AsyncTestingSessionLocal() as session:
-            count = await user_repo.bulk_update_status(
+            affected_ids = await user_repo.bulk_update_status(
                 session, user_ids=[], is_active=False
             )
-            assert count == 0
+            assert affected_ids == []
 
     @pytest.mark.asyncio
     async def test_bulk_update_status_reactivate(self, async_test_db):
@@ -424,10 +450,10 @@ class TestBulkUpdateStatus:
 
         # Reactivate
         async with AsyncTestingSessionLocal() as session:
-            count = await user_repo.bulk_update_status(
+            affected_ids = await user_repo.bulk_update_status(
                 session, user_ids=[user_id], is_active=True
             )
-            assert count == 1
+            assert affected_ids == [user_id]
 
         # Verify active
         async with AsyncTestingSessionLocal() as session:
@@ -458,8 +484,8 @@ class TestBulkSoftDelete:
 
         # Bulk delete
         async with AsyncTestingSessionLocal() as session:
-            count = await user_repo.bulk_soft_delete(session, user_ids=user_ids)
-            assert count == 3
+            affected_ids = await user_repo.bulk_soft_delete(session, user_ids=user_ids)
+            assert set(affected_ids) == set(user_ids)
 
         # Verify all are soft deleted
         async with AsyncTestingSessionLocal() as session:
@@ -489,10 +515,10 @@ class TestBulkSoftDelete:
         # Bulk delete, excluding first user
         exclude_id = user_ids[0]
         async with AsyncTestingSessionLocal() as session:
-            count = await user_repo.bulk_soft_delete(
+            affected_ids = await user_repo.bulk_soft_delete(
                 session, user_ids=user_ids, exclude_user_id=exclude_id
             )
-            assert count == 2  # Only 2 deleted
+            assert set(affected_ids) == set(user_ids[1:])  # Only 2 deleted
 
         # Verify excluded user is NOT deleted
         async with AsyncTestingSessionLocal() as session:
@@ -501,12 +527,12 @@ class TestBulkSoftDelete:
 
     @pytest.mark.asyncio
     async def test_bulk_soft_delete_empty_list(self, async_test_db):
-        """Test bulk delete with empty list returns 0."""
+        """Test bulk delete with empty list returns no IDs."""
         _test_engine, AsyncTestingSessionLocal = async_test_db
 
         async with AsyncTestingSessionLocal() as session:
-            count = await user_repo.bulk_soft_delete(session, user_ids=[])
-            assert count == 0
+            affected_ids = await user_repo.bulk_soft_delete(session, user_ids=[])
+            assert affected_ids == []
 
     @pytest.mark.asyncio
     async def test_bulk_soft_delete_all_excluded(self, async_test_db):
@@ -526,10 +552,10 @@ class TestBulkSoftDelete:
 
         # Try to delete but exclude
         async with AsyncTestingSessionLocal() as session:
-            count = await user_repo.bulk_soft_delete(
+            affected_ids = await user_repo.bulk_soft_delete(
                 session, user_ids=[user_id], exclude_user_id=user_id
             )
-            assert count == 0
+            assert affected_ids == []
 
     @pytest.mark.asyncio
     async def test_bulk_soft_delete_already_deleted(self, async_test_db):
@@ -552,8 +578,8 @@ class TestBulkSoftDelete:
 
         # Try to delete again
         async with AsyncTestingSessionLocal() as session:
-            count = await user_repo.bulk_soft_delete(session, user_ids=[user_id])
-            assert count == 0  # Already deleted
+            affected_ids = await user_repo.bulk_soft_delete(session, user_ids=[user_id])
+            assert affected_ids == []  # Already deleted
 
 
 class TestUtilityMethods:
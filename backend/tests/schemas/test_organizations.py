@@ -6,12 +6,17 @@ Covers Pydantic validators for:
 - Name validation (lines 40, 77)
 """
 
+from datetime import UTC, datetime
+from uuid import uuid4
+
 import pytest
 from pydantic import ValidationError
 
+from app.models.organization import Organization
 from app.schemas.organizations import (
     OrganizationBase,
     OrganizationCreate,
+    OrganizationResponse,
     OrganizationUpdate,
 )
 
@@ -166,3 +171,39 @@ class TestOrganizationUpdateValidators:
         assert org.name == "New Name"
         assert org.slug is None
         assert org.description is None
+
+
+class TestOrganizationResponseFromOrg:
+    """Test building OrganizationResponse from an Organization row."""
+
+    def test_from_org(self):
+        """Test fields and member_count are read from the row."""
+        org = Organization(
+            id=uuid4(),
+            name="Acme",
+            slug="acme",
+            description="Widgets",
+            is_active=True,
+            settings={"theme": "dark"},
+            created_at=datetime.now(UTC),
+        )
+        org.member_count = 7
+
+        response = OrganizationResponse.from_org(org)
+
+        assert response.id == org.id
+        assert response.slug == "acme"
+        assert response.settings == {"theme": "dark"}
+        assert response.member_count == 7
+
+    def test_from_org_without_member_count(self):
+        """Test a row loaded without member_count reports no members."""
+        org = Organization(
+            id=uuid4(),
+            name="Acme",
+            slug="acme",
+            is_active=True,
+            created_at=datetime.now(UTC),
+        )
+
+        assert OrganizationResponse.from_org(org).member_count == 0
@@ -505,6 +505,64 @@ class TestTokenRefresh:
         assert "refresh_token" in new_result
         assert new_result["refresh_token"] != refresh_token  # Token rotation
 
+    @pytest.mark.asyncio
+    async def test_refresh_token_hash_stored_as_raw_digest(
+        self, db, public_client, test_user
+    ):
+        """Test the refresh token hash is stored as 32 raw bytes."""
+        from sqlalchemy import text
+
+        with patch("app.services.oauth_provider_service.settings") as mock_settings:
+            mock_settings.OAUTH_ISSUER = "http://localhost:8000"
+            mock_settings.SECRET_KEY = "test_secret_key_for_jwt_signing_123456"
+            mock_settings.ALGORITHM = "HS256"
+
+            result = await service.create_tokens(
+                db=db,
+                client=public_client,
+                user=test_user,
+                scope="openid",
+            )
+
+        stored = (
+            await db.execute(
+                text("SELECT token_hash FROM oauth_provider_refresh_tokens")
+            )
+        ).scalar_one()
+        assert stored == bytes.fromhex(service.hash_token(result["refresh_token"]))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("ip_address", "expected"),
+        [("203.0.113.7", "203.0.113.7"), ("::1", "::1"), ("testclient", None)],
+    )
+    async def test_refresh_token_ip_address_stored_only_if_valid(
+        self, db, public_client, test_user, ip_address, expected
+    ):
+        """Test the refresh token keeps valid IP addresses and drops others."""
+        from sqlalchemy import select
+
+        from app.models.oauth_provider_token import OAuthProviderRefreshToken
+
+        with patch("app.services.oauth_provider_service.settings") as mock_settings:
+            mock_settings.OAUTH_ISSUER = "http://localhost:8000"
+            mock_settings.SECRET_KEY = "test_secret_key_for_jwt_signing_123456"
+            mock_settings.ALGORITHM = "HS256"
+
+            await service.create_tokens(
+                db=db,
+                client=public_client,
+                user=test_user,
+                scope="openid",
+                ip_address=ip_address,
+            )
+
+        db.expire_all()
+        stored = (
+            await db.execute(select(OAuthProviderRefreshToken.ip_address))
+        ).scalar_one()
+        assert stored == expected
+
     @pytest.mark.asyncio
     async def test_refresh_tokens_invalid_token(self, db, public_client):
         """Test refreshing with invalid token fails."""
@@ -257,6 +257,40 @@ class TestUnlinkProvider:
             )
             assert account is None
 
+    @pytest.mark.asyncio
+    async def test_unlink_loads_password_hash_for_cached_user(
+        self, async_test_db, async_test_user
+    ):
+        """Test a user without a loaded password hash still counts as having one."""
+        _engine, AsyncTestingSessionLocal = async_test_db
+
+        async with AsyncTestingSessionLocal() as session:
+            account_data = OAuthAccountCreate(
+                user_id=async_test_user.id,
+                provider="google",
+                provider_user_id="google_456",
+            )
+            await oauth_account.create_account(session, obj_in=account_data)
+
+        async with AsyncTestingSessionLocal() as session:
+            from sqlalchemy import select
+            from sqlalchemy.orm import defer
+
+            from app.models.user import User
+
+            # The shape of a user served from the auth cache
+            result = await session.execute(
+                select(User)
+                .where(User.id == async_test_user.id)
+                .options(defer(User.password_hash))
+            )
+            user = result.scalar_one()
+
+            success = await OAuthService.unlink_provider(
+                session, user=user, provider="google"
+            )
+            assert success is True
+
     @pytest.mark.asyncio
     async def test_unlink_not_found_raises(self, async_test_db, async_test_user):
         """Test unlinking non-existent provider raises error."""
@@ -174,6 +174,41 @@ class TestGetMemberCount:
             assert count == 1
 
 
+class TestGetOrgWithMemberCount:
+    """Tests for OrganizationService.get_org_with_member_count method."""
+
+    @pytest.mark.asyncio
+    async def test_get_org_with_member_count(self, async_test_db, async_test_user):
+        """Test the org and its member count are returned together."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        async with AsyncTestingSessionLocal() as session:
+            created = await organization_service.create_organization(
+                session, obj_in=_make_org_create()
+            )
+            await organization_service.add_member(
+                session,
+                organization_id=created.id,
+                user_id=async_test_user.id,
+            )
+
+        async with AsyncTestingSessionLocal() as session:
+            org = await organization_service.get_org_with_member_count(
+                session, created.id
+            )
+            assert org.id == created.id
+            assert org.member_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_org_with_member_count_not_found(self, async_test_db):
+        """Test a missing organization raises NotFoundError."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        async with AsyncTestingSessionLocal() as session:
+            with pytest.raises(NotFoundError):
+                await organization_service.get_org_with_member_count(
+                    session, uuid.uuid4()
+                )
+
+
 class TestGetMultiWithMemberCounts:
     """Tests for OrganizationService.get_multi_with_member_counts method."""
 
@@ -218,8 +253,8 @@ class TestGetMultiWithMemberCounts:
                 session, skip=0, limit=10, search=f"Searchable Org {unique}"
             )
             assert count >= 1
-            # Each element is a dict with key "organization" (an Organization obj) and "member_count"
-            names = [o["organization"].name for o in orgs]
+            # Each element is an Organization with member_count loaded
+            names = [o.name for o in orgs]
             assert org_name in names
 
 
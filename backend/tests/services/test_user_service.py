@@ -2,6 +2,7 @@
 """Tests for the UserService class."""
 
 import uuid
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from sqlalchemy import select
@@ -152,15 +153,15 @@ class TestBulkUpdateStatus:
 
     @pytest.mark.asyncio
     async def test_bulk_update_status(self, async_test_db, async_test_user):
-        """Test bulk activating users returns correct count."""
+        """Test bulk activating users returns the updated IDs."""
         _test_engine, AsyncTestingSessionLocal = async_test_db
         async with AsyncTestingSessionLocal() as session:
-            count = await user_service.bulk_update_status(
+            affected_ids = await user_service.bulk_update_status(
                 session,
                 user_ids=[async_test_user.id],
                 is_active=True,
             )
-            assert count >= 1
+            assert affected_ids == [async_test_user.id]
 
         async with AsyncTestingSessionLocal() as session:
             result = await session.execute(
@@ -176,14 +177,14 @@ class TestBulkSoftDelete:
 
     @pytest.mark.asyncio
     async def test_bulk_soft_delete(self, async_test_db, async_test_user):
-        """Test bulk soft-deleting users returns correct count."""
+        """Test bulk soft-deleting users returns the deleted IDs."""
         _test_engine, AsyncTestingSessionLocal = async_test_db
         async with AsyncTestingSessionLocal() as session:
-            count = await user_service.bulk_soft_delete(
+            affected_ids = await user_service.bulk_soft_delete(
                 session,
                 user_ids=[async_test_user.id],
             )
-            assert count >= 1
+            assert affected_ids == [async_test_user.id]
 
         async with AsyncTestingSessionLocal() as session:
             result = await session.execute(
@@ -206,8 +207,53 @@ class TestGetStats:
             assert "total_users" in stats
             assert "active_count" in stats
             assert "inactive_count" in stats
-            assert "all_users" in stats
             assert stats["total_users"] >= 1
             assert stats["active_count"] >= 1
-            assert isinstance(stats["all_users"], list)
-            assert len(stats["all_users"]) >= 1
+
+    @pytest.mark.asyncio
+    async def test_get_daily_registrations(self, async_test_db):
+        """Test registrations are bucketed per day from the cutoff onwards."""
+        _test_engine, AsyncTestingSessionLocal = async_test_db
+        now = datetime.now(UTC)
+        async with AsyncTestingSessionLocal() as session:
+            for i, (days_ago, is_active) in enumerate(
+                [(0, True), (0, False), (2, True), (40, True)]
+            ):
+                session.add(
+                    User(
+                        email=f"daily{i}@example.com",
+                        password_hash="x",
+                        first_name="Daily",
+                        is_active=is_active,
+                        created_at=now - timedelta(days=days_ago),
+                    )
+                )
+            await session.commit()
+
+            daily = await user_service.get_daily_registrations(
+                session, since=now - timedelta(days=29)
+            )
+
+        assert daily == {
+            (now - timedelta(days=2)).date(): (1, 1),
+            now.date(): (2, 1),
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_daily_registrations_buckets_by_utc_on_postgresql(self):
+        """Test PostgreSQL buckets by the UTC day, not the session TimeZone."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from sqlalchemy.dialects import postgresql
+
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        result = MagicMock()
+        result.all.return_value = []
+        db.execute = AsyncMock(return_value=result)
+
+        await user_service.get_daily_registrations(db, since=datetime.now(UTC))
+
+        statement = db.execute.await_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "date(timezone(" in sql
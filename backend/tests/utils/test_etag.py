@@ -0,0 +1,80 @@
+# tests/utils/test_etag.py
+"""
+Tests for conditional GET utility functions.
+"""
+
+from starlette.requests import Request
+
+from app.utils.etag import etag_matches, make_list_etag, not_modified
+
+
+def _request(query: str = "", headers: dict[str, str] | None = None) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/admin/users",
+            "query_string": query.encode(),
+            "headers": [
+                (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+            ],
+        }
+    )
+
+
+class TestMakeListEtag:
+    """Tests for make_list_etag function."""
+
+    def test_weak_and_stable(self):
+        """Test the same request and markers give the same weak ETag."""
+        etag = make_list_etag(_request("page=1"), 3, "2026-01-01")
+        assert etag.startswith('W/"')
+        assert etag == make_list_etag(_request("page=1"), 3, "2026-01-01")
+
+    def test_query_order_does_not_matter(self):
+        """Test reordered query parameters give the same ETag."""
+        assert make_list_etag(_request("page=1&limit=20"), 1) == make_list_etag(
+            _request("limit=20&page=1"), 1
+        )
+
+    def test_changes_with_markers_and_query(self):
+        """Test different data or a different page give a different ETag."""
+        etag = make_list_etag(_request("page=1"), 3)
+        assert etag != make_list_etag(_request("page=1"), 4)
+        assert etag != make_list_etag(_request("page=2"), 3)
+
+
+class TestEtagMatches:
+    """Tests for etag_matches function."""
+
+    def test_no_header(self):
+        """Test a request without If-None-Match never matches."""
+        assert etag_matches(_request(), 'W/"abc"') is False
+
+    def test_weak_comparison(self):
+        """Test strong and weak forms of the same tag match."""
+        assert etag_matches(_request(headers={"If-None-Match": '"abc"'}), 'W/"abc"')
+        assert etag_matches(_request(headers={"If-None-Match": 'W/"abc"'}), 'W/"abc"')
+
+    def test_list_and_wildcard(self):
+        """Test a tag inside a list and the * wildcard both match."""
+        request = _request(headers={"If-None-Match": 'W/"x", W/"abc"'})
+        assert etag_matches(request, 'W/"abc"')
+        assert etag_matches(_request(headers={"If-None-Match": "*"}), 'W/"abc"')
+
+    def test_mismatch(self):
+        """Test a different tag does not match."""
+        request = _request(headers={"If-None-Match": 'W/"other"'})
+        assert etag_matches(request, 'W/"abc"') is False
+
+
+class TestNotModified:
+    """Tests for not_modified function."""
+
+    def test_empty_304_with_headers(self):
+        """Test the response is an empty 304 carrying the ETag."""
+        response = not_modified('W/"abc"')
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == 'W/"abc"'
+        assert response.headers["cache-control"] == "private, must-revalidate"
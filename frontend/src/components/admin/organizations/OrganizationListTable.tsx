@@ -38,6 +38,9 @@ export function OrganizationListTable({
   onEditOrganization,
   onViewMembers,
 }: OrganizationListTableProps) {
+  // Without a count, offer the pages up to the next one
+  const pageCount = pagination.total_pages ?? pagination.page + Number(pagination.has_next);
+
   return (
     <div className="space-y-4">
       {/* Table */}
@@ -131,8 +134,15 @@ export function OrganizationListTable({
         <div className="flex items-center justify-between">
           <div className="text-sm text-muted-foreground">
             Showing {(pagination.page - 1) * pagination.page_size + 1} to{' '}
-            {Math.min(pagination.page * pagination.page_size, pagination.total)} of{' '}
-            {pagination.total} organizations
+            {Math.min(pagination.page * pagination.page_size, pagination.total ?? Infinity)}
+            {pagination.total !== null && (
+              <>
+                {' '}
+                of {pagination.is_estimate && 'about '}
+                {pagination.total}
+              </>
+            )}{' '}
+            organizations
           </div>
           <div className="flex gap-2">
             <Button
@@ -144,7 +154,7 @@ export function OrganizationListTable({
               Previous
             </Button>
             <div className="flex items-center gap-1">
-              {Array.from({ length: pagination.total_pages }, (_, i) => i + 1)
+              {Array.from({ length: pageCount }, (_, i) => i + 1)
                 .filter(
                   (page) =>
                     page === 1 ||
@@ -60,6 +60,9 @@ export function OrganizationMembersTable({
   isLoading,
   onPageChange,
 }: OrganizationMembersTableProps) {
+  // Without a count, offer the pages up to the next one
+  const pageCount = pagination.total_pages ?? pagination.page + Number(pagination.has_next);
+
   return (
     <div className="space-y-4">
       {/* Table */}
@@ -136,8 +139,15 @@ export function OrganizationMembersTable({
         <div className="flex items-center justify-between">
           <div className="text-sm text-muted-foreground">
             Showing {(pagination.page - 1) * pagination.page_size + 1} to{' '}
-            {Math.min(pagination.page * pagination.page_size, pagination.total)} of{' '}
-            {pagination.total} members
+            {Math.min(pagination.page * pagination.page_size, pagination.total ?? Infinity)}
+            {pagination.total !== null && (
+              <>
+                {' '}
+                of {pagination.is_estimate && 'about '}
+                {pagination.total}
+              </>
+            )}{' '}
+            members
           </div>
           <div className="flex gap-2">
             <Button
@@ -149,7 +159,7 @@ export function OrganizationMembersTable({
               Previous
             </Button>
             <div className="flex items-center gap-1">
-              {Array.from({ length: pagination.total_pages }, (_, i) => i + 1)
+              {Array.from({ length: pageCount }, (_, i) => i + 1)
                 .filter(
                   (page) =>
                     page === 1 ||
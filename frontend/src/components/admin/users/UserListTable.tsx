@@ -60,6 +60,9 @@ export function UserListTable({
   onEditUser,
   currentUserId,
 }: UserListTableProps) {
+  // Without a count, offer the pages up to the next one
+  const pageCount = pagination.total_pages ?? pagination.page + Number(pagination.has_next);
+
   const [searchValue, setSearchValue] = useState('');
 
   // Debounce search
@@ -226,8 +229,15 @@ export function UserListTable({
         <div className="flex items-center justify-between">
           <div className="text-sm text-muted-foreground">
             Showing {(pagination.page - 1) * pagination.page_size + 1} to{' '}
-            {Math.min(pagination.page * pagination.page_size, pagination.total)} of{' '}
-            {pagination.total} users
+            {Math.min(pagination.page * pagination.page_size, pagination.total ?? Infinity)}
+            {pagination.total !== null && (
+              <>
+                {' '}
+                of {pagination.is_estimate && 'about '}
+                {pagination.total}
+              </>
+            )}{' '}
+            users
           </div>
           <div className="flex gap-2">
             <Button
@@ -239,7 +249,7 @@ export function UserListTable({
               Previous
             </Button>
             <div className="flex items-center gap-1">
-              {Array.from({ length: pagination.total_pages }, (_, i) => i + 1)
+              {Array.from({ length: pageCount }, (_, i) => i + 1)
                 .filter(
                   (page) =>
                     page === 1 ||
@@ -1091,9 +1091,9 @@ export type PaginationMeta = {
     /**
      * Total
      *
-     * Total number of items
+     * Total number of items (null when the count was skipped)
      */
-    total: number;
+    total: number | null;
     /**
      * Page
      *
@@ -1109,9 +1109,9 @@ export type PaginationMeta = {
     /**
      * Total Pages
      *
-     * Total number of pages
+     * Total number of pages (null when the count was skipped)
      */
-    total_pages: number;
+    total_pages: number | null;
     /**
      * Has Next
      *
@@ -1124,6 +1124,18 @@ export type PaginationMeta = {
      * Whether there is a previous page
      */
     has_prev: boolean;
+    /**
+     * Next Cursor
+     *
+     * Cursor for the next page when the list supports keyset paging
+     */
+    next_cursor?: string | null;
+    /**
+     * Is Estimate
+     *
+     * Whether total is an estimate rather than an exact count
+     */
+    is_estimate?: boolean;
 };
 
 /**
@@ -1176,6 +1188,42 @@ export type PasswordResetRequest = {
     email: string;
 };
 
+/**
+ * PoolStatsResponse
+ */
+export type PoolStatsResponse = {
+    /**
+     * Size
+     *
+     * Configured number of pooled connections
+     */
+    size: number;
+    /**
+     * Checked In
+     *
+     * Idle connections in the pool
+     */
+    checked_in: number;
+    /**
+     * Checked Out
+     *
+     * Connections currently in use
+     */
+    checked_out: number;
+    /**
+     * Overflow
+     *
+     * Connections open beyond size
+     */
+    overflow: number;
+    /**
+     * Max Overflow
+     *
+     * Configured overflow limit
+     */
+    max_overflow: number;
+};
+
 /**
  * RefreshTokenRequest
  */
@@ -2480,6 +2528,22 @@ export type AdminGetStatsResponses = {
 
 export type AdminGetStatsResponse = AdminGetStatsResponses[keyof AdminGetStatsResponses];
 
+export type AdminGetPoolStatsData = {
+    body?: never;
+    path?: never;
+    query?: never;
+    url: '/api/v1/admin/pool-stats';
+};
+
+export type AdminGetPoolStatsResponses = {
+    /**
+     * Successful Response
+     */
+    200: PoolStatsResponse;
+};
+
+export type AdminGetPoolStatsResponse = AdminGetPoolStatsResponses[keyof AdminGetPoolStatsResponses];
+
 export type AdminListUsersData = {
     body?: never;
     path?: never;
@@ -2502,6 +2566,18 @@ export type AdminListUsersData = {
          * Search by email, name
          */
         search?: string | null;
+        /**
+         * Include Total
+         *
+         * Count matching items; false skips the COUNT and only reports has_next
+         */
+        include_total?: boolean;
+        /**
+         * Cursor
+         *
+         * next_cursor of the previous page; pages by keyset instead of offset and skips the COUNT
+         */
+        cursor?: string | null;
         /**
          * Page
          */
@@ -2562,6 +2638,20 @@ export type AdminCreateUserResponses = {
 
 export type AdminCreateUserResponse = AdminCreateUserResponses[keyof AdminCreateUserResponses];
 
+export type AdminExportUsersData = {
+    body?: never;
+    path?: never;
+    query?: never;
+    url: '/api/v1/admin/users/export';
+};
+
+export type AdminExportUsersResponses = {
+    /**
+     * Successful Response
+     */
+    200: unknown;
+};
+
 export type AdminDeleteUserData = {
     body?: never;
     path: {
@@ -2753,6 +2843,18 @@ export type AdminListOrganizationsData = {
          * Search by name, slug, description
          */
         search?: string | null;
+        /**
+         * Include Total
+         *
+         * Count matching items; false skips the COUNT and only reports has_next
+         */
+        include_total?: boolean;
+        /**
+         * Cursor
+         *
+         * next_cursor of the previous page; pages by keyset instead of offset and skips the COUNT
+         */
+        cursor?: string | null;
         /**
          * Page
          */
@@ -144,12 +144,14 @@ export function useAdminStats() {
  * Pagination metadata structure
  */
 export interface PaginationMeta {
-  total: number;
+  total: number | null;
   page: number;
   page_size: number;
-  total_pages: number;
+  total_pages: number | null;
   has_next: boolean;
   has_prev: boolean;
+  next_cursor?: string | null;
+  is_estimate?: boolean;
 }
 
 /**
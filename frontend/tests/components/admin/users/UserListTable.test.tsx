@@ -309,6 +309,30 @@ describe('UserListTable', () => {
       expect(screen.getByText(/Showing 21 to 40 of 100 users/)).toBeInTheDocument();
     });
 
+    it('marks an estimated total', () => {
+      render(
+        <UserListTable
+          {...paginatedProps}
+          pagination={{ ...paginatedProps.pagination, is_estimate: true }}
+        />
+      );
+
+      expect(screen.getByText(/Showing 21 to 40 of about 100 users/)).toBeInTheDocument();
+    });
+
+    it('pages up to the next page when the total is unknown', () => {
+      render(
+        <UserListTable
+          {...paginatedProps}
+          pagination={{ ...paginatedProps.pagination, total: null, total_pages: null }}
+        />
+      );
+
+      expect(screen.getByText(/Showing 21 to 40 users/)).toBeInTheDocument();
+      expect(screen.getByRole('button', { name: '3' })).toBeInTheDocument();
+      expect(screen.queryByRole('button', { name: '4' })).not.toBeInTheDocument();
+    });
+
     it('renders previous button', () => {
       render(<UserListTable {...paginatedProps} />);
 